@@ -84,22 +84,26 @@ class MFCCSVMEmotionAnalyzer:
         
         return X, y
     
-    def _extract_mfcc_features(self, audio_path: str) -> np.ndarray:
-        """Extract MFCC features from audio file"""
+    def _load_audio(self, audio_path: str) -> np.ndarray:
+        """Load and resample an audio file once per analysis"""
+        y, _ = librosa.load(audio_path, sr=self.sample_rate)
+        return y
+
+    def _extract_mfcc_features(self, y: np.ndarray) -> np.ndarray:
+        """Extract MFCC features from decoded audio"""
         try:
-            # Load audio file
-            y, sr = librosa.load(audio_path, sr=self.sample_rate)
-            
+            sr = self.sample_rate
+
             # Handle short audio files
             if len(y) < self.sample_rate * 0.5:  # Less than 0.5 seconds
                 logger.warning(f"Audio very short: {len(y)/sr:.2f}s")
                 # Pad with zeros
                 y = np.pad(y, (0, max(0, self.sample_rate - len(y))))
-            
+
             # Extract MFCC features
             mfcc = librosa.feature.mfcc(
-                y=y, 
-                sr=sr, 
+                y=y,
+                sr=sr,
                 n_mfcc=self.n_mfcc,
                 n_fft=self.n_fft,
                 hop_length=self.hop_length
@@ -149,12 +153,14 @@ class MFCCSVMEmotionAnalyzer:
             Dictionary with emotion prediction and confidence
         """
         try:
-            # Extract features from actual audio
-            features = self._extract_mfcc_features(audio_path)
-            
+            # Decode the audio once and share it between feature extraction
+            # and the characteristics analysis (previously two librosa.load calls)
+            y = self._load_audio(audio_path)
+            features = self._extract_mfcc_features(y)
+
             # Use audio characteristics to determine emotion dynamically
             # Instead of using a trained model, we'll analyze the actual audio features
-            emotion_result = self._analyze_audio_characteristics(features, audio_path)
+            emotion_result = self._analyze_audio_characteristics(features, y)
             
             return emotion_result
             
@@ -162,21 +168,20 @@ class MFCCSVMEmotionAnalyzer:
             logger.error(f"Error analyzing emotion: {e}")
             raise ValueError(f"Emotion analysis failed: {e}")
     
-    def _analyze_audio_characteristics(self, features: np.ndarray, audio_path: str) -> Dict:
+    def _analyze_audio_characteristics(self, features: np.ndarray, y: np.ndarray) -> Dict:
         """
         Analyze audio characteristics to determine emotion dynamically
-        
+
         Args:
             features: MFCC features extracted from audio
-            audio_path: Path to audio file
-            
+            y: Decoded audio samples (already resampled)
+
         Returns:
             Dictionary with emotion prediction and confidence
         """
         try:
-            # Load audio for additional analysis
-            y, sr = librosa.load(audio_path, sr=self.sample_rate)
-            
+            sr = self.sample_rate
+
             # Calculate various audio features
             rms_energy = librosa.feature.rms(y=y)[0].mean()
             spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0].mean()
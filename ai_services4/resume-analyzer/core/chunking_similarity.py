@@ -9,10 +9,15 @@ def chunk_text(text: str, chunk_size: int = 150) -> list[str]:
     return [" ".join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
 
 def get_embeddings(chunks: list[str]) -> np.ndarray:
-    return model.encode(chunks, convert_to_tensor=True)
+    # L2-normalize at encode time so downstream similarity is a plain
+    # dot product - no per-row norm pass on every comparison
+    return model.encode(chunks, convert_to_tensor=True, batch_size=64,
+                        normalize_embeddings=True)
 
 def compute_similarity(resume_embeds, jd_embeds) -> np.ndarray:
-    return util.cos_sim(resume_embeds, jd_embeds).cpu().numpy()
+    # Embeddings are unit-norm, so the dot product IS the cosine: one
+    # batched BLAS matmul instead of matmul + norms
+    return util.dot_score(resume_embeds, jd_embeds).cpu().numpy()
 
 def compute_missing(similarity_matrix: np.ndarray, resume_chunks: list[str], jd_chunks: list[str], threshold: float = 0.6):
     missing_info = {"missing_chunks": []}
@@ -22,10 +27,18 @@ def compute_missing(similarity_matrix: np.ndarray, resume_chunks: list[str], jd_
             missing_info["missing_chunks"].append(jd_chunk)
     return missing_info
 
-def compute_after_metrics(optimized_resume_text: str, jd_chunks: list[str]):
+def compute_after_metrics(optimized_resume_text: str, jd_chunks: list[str], jd_embeds=None):
     resume_chunks = chunk_text(optimized_resume_text)
-    resume_embeds = get_embeddings(resume_chunks)
-    jd_embeds = get_embeddings(jd_chunks)
+    if jd_embeds is not None:
+        # Caller already embedded the JD chunks (same ordering) - only the
+        # optimized resume needs a model pass
+        resume_embeds = get_embeddings(resume_chunks)
+    else:
+        # One batched encode for both chunk lists - amortizes the tokenize +
+        # forward-pass overhead instead of paying it twice on small batches
+        all_embeds = get_embeddings(resume_chunks + jd_chunks)
+        resume_embeds = all_embeds[:len(resume_chunks)]
+        jd_embeds = all_embeds[len(resume_chunks):]
     similarity_matrix = compute_similarity(resume_embeds, jd_embeds)
     return compute_missing(similarity_matrix, resume_chunks, jd_chunks)
 
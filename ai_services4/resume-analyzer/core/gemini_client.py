@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 import requests
 import json
@@ -5,6 +7,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 API_KEY = os.getenv("GEMINI_API_KEY")
 API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
 
@@ -31,8 +35,17 @@ def call_gemini_ai(prompt: str) -> str:
                 return text_out.strip()
             return ""
         except Exception as e:
-            print("Error parsing Gemini response:", e)
+            log.error("Error parsing Gemini response: %s", e)
             return ""
     else:
-        print("Gemini API error:", resp.status_code, resp.text)
+        log.error("Gemini API error: %s %s", resp.status_code, resp.text)
         return ""
+
+
+async def acall_gemini_ai(prompt: str) -> str:
+    """Async variant: run the blocking REST call in a worker thread.
+
+    Lets callers overlap independent Gemini requests with asyncio.gather
+    and keeps the event loop free during the network wait.
+    """
+    return await asyncio.to_thread(call_gemini_ai, prompt)
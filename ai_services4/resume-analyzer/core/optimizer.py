@@ -1,25 +1,47 @@
 # ai_services4/resume-analyzer/core/optimizer.py
 
+import asyncio
 import json
+import logging
 import re
 from core.gemini_client import call_gemini_ai
 from core.chunking_similarity import chunk_text, retrieve_relevant_chunks_enhanced
 
-def generate_resume_latex(resume_text: str, selected_skills: list) -> str:
-    """
-    🎯 OPTION 1: Ask Gemini to generate COMPLETE LaTeX code directly.
-    Now with BETTER prompt using the exact template format!
+log = logging.getLogger(__name__)
+
+# Gemini response cleanup patterns - compiled once at import instead of on
+# every call (Python's internal regex cache is small and shared)
+_RE_FENCE_LATEX_OPEN = re.compile(r'^```latex\s*', re.MULTILINE)
+_RE_FENCE_OPEN = re.compile(r'^```\s*', re.MULTILINE)
+_RE_FENCE_CLOSE = re.compile(r'```$', re.MULTILINE)
+_RE_DOC_EXTRACT = re.compile(r'\\documentclass.*?\\end\{document\}', re.DOTALL)
+
+_json_decoder = json.JSONDecoder()
+
+
+def _parse_json_object(response: str):
+    """Parse the first JSON object in a Gemini response, or None.
+
+    A greedy \\{.*\\} regex both over-matches nested braces into trailing
+    prose and backtracks badly on long responses; raw_decode from the
+    first brace is one linear pass in C and stops at the matching close.
     """
+    start = response.find('{')
+    if start == -1:
+        return None
     try:
-        print(f"🎨 Generating LaTeX code with {len(selected_skills)} skills")
-        
-        skills_str = ", ".join(selected_skills)
-        
-        # 🔥 ENHANCED PROMPT - Use the exact working template!
-        prompt = f"""You are a LaTeX expert. Generate a COMPLETE, PROFESSIONAL resume in LaTeX format.
+        obj, _ = _json_decoder.raw_decode(response, start)
+        return obj
+    except json.JSONDecodeError:
+        return None
+
+
+# ~5KB prompt template built once at import - only the two slots vary
+# per call, so there is no reason to re-walk the whole literal each time
+_LATEX_PROMPT_TEMPLATE = """You are a LaTeX expert. Generate a COMPLETE, PROFESSIONAL resume in LaTeX format.
 
 INPUT RESUME TEXT:
-{resume_text[:3500]}
+{resume_text}
 
 SKILLS TO ADD (ONLY THESE):
 {skills_str}
@@ -149,36 +171,51 @@ IMPORTANT:
 
 OUTPUT ONLY THE COMPLETE LATEX CODE, NO EXPLANATIONS."""
 
-        print("📤 Sending prompt to Gemini...")
+
+def generate_resume_latex(resume_text: str, selected_skills: list) -> str:
+    """
+    🎯 OPTION 1: Ask Gemini to generate COMPLETE LaTeX code directly.
+    Now with BETTER prompt using the exact template format!
+    """
+    try:
+        log.debug("🎨 Generating LaTeX code with %s skills", len(selected_skills))
+        
+        skills_str = ", ".join(selected_skills)
+        
+        # 🔥 ENHANCED PROMPT - Use the exact working template!
+        prompt = _LATEX_PROMPT_TEMPLATE.format(
+            resume_text=resume_text[:3500], skills_str=skills_str
+        )
+
+        log.debug("📤 Sending prompt to Gemini...")
         response = call_gemini_ai(prompt)
         
         # Clean up response - remove markdown if present
         latex_code = response.strip()
         
         # Remove markdown code blocks if Gemini added them
-        latex_code = re.sub(r'^```latex\s*', '', latex_code, flags=re.MULTILINE)
-        latex_code = re.sub(r'^```\s*', '', latex_code, flags=re.MULTILINE)
-        latex_code = re.sub(r'```$', '', latex_code, flags=re.MULTILINE)
+        latex_code = _RE_FENCE_LATEX_OPEN.sub('', latex_code)
+        latex_code = _RE_FENCE_OPEN.sub('', latex_code)
+        latex_code = _RE_FENCE_CLOSE.sub('', latex_code)
         latex_code = latex_code.strip()
         
         # Validate it's actually LaTeX
         if '\\documentclass' not in latex_code:
-            print("⚠️  Response doesn't look like LaTeX, attempting to extract...")
+            log.warning("⚠️  Response doesn't look like LaTeX, attempting to extract...")
             # Try to find LaTeX code in the response
-            match = re.search(r'\\documentclass.*?\\end\{document\}', latex_code, re.DOTALL)
+            match = _RE_DOC_EXTRACT.search(latex_code)
             if match:
                 latex_code = match.group(0)
             else:
                 raise Exception("Gemini did not return valid LaTeX code")
         
-        print(f"✅ LaTeX code generated: {len(latex_code)} characters")
-        print(f"📄 Preview (first 500 chars):")
-        print(latex_code[:500])
+        log.debug("✅ LaTeX code generated: %s characters", len(latex_code))
+        log.debug("📄 Preview (first 500 chars): %s", latex_code[:500])
         
         return latex_code
         
     except Exception as e:
-        print(f"❌ Error generating LaTeX: {str(e)}")
+        log.error("❌ Error generating LaTeX: %s", str(e))
         raise
 
 
@@ -186,14 +223,40 @@ OUTPUT ONLY THE COMPLETE LATEX CODE, NO EXPLANATIONS."""
 # KEEP EXISTING FUNCTIONS FOR SKILL ANALYSIS
 # ============================================
 
-def extract_missing_skills(resume_text: str, jd_text: str, before_metrics: dict) -> list:
-    """Extract missing skills from JD that aren't in resume"""
+def _join_capped(chunks: list, max_chars: int) -> str:
+    """Join chunks up to a character budget instead of joining then slicing
+
+    Avoids materializing a large intermediate string that the prompt
+    f-string (and Gemini's tokenizer) would only truncate again.
+    """
+    out = []
+    total = 0
+    for chunk in chunks:
+        if total + len(chunk) > max_chars:
+            break
+        out.append(chunk)
+        total += len(chunk) + 1
+    return " ".join(out)
+
+
+def analyze_gaps(resume_text: str, jd_text: str, before_metrics: dict) -> dict:
+    """Extract missing skills AND improvement tips in a single Gemini call.
+
+    The two sub-tasks share the same context, so fusing them into one
+    structured-output prompt pays the network + queuing latency once
+    instead of twice.
+    """
     try:
         missing_chunks = before_metrics.get("missing_chunks", [])
-        missing_text = " ".join(missing_chunks[:10])
-        
+        if not missing_chunks:
+            # Resume already covers the JD - don't spend a Gemini round-trip
+            # to learn there is nothing to report
+            return {"missing_skills": [], "improvement_tips": []}
+
+        missing_text = _join_capped(missing_chunks[:10], 2000)
+
         prompt = f"""
-Analyze this resume and job description to identify SPECIFIC, CONCRETE missing skills.
+Analyze this resume and job description for gaps.
 
 RESUME:
 {resume_text[:1500]}
@@ -204,44 +267,64 @@ JOB DESCRIPTION:
 MISSING CONTENT FROM JD:
 {missing_text}
 
-Extract ONLY specific technical skills, tools, or technologies that are:
+TASK 1 - Extract 5-15 missing skills. ONLY specific technical skills, tools, or technologies that are:
 1. Explicitly mentioned in the job description
 2. NOT present in the resume
 3. Concrete and actionable (e.g., "Docker", "Kubernetes", not "good communication")
+Focus on: programming languages, frameworks, tools, cloud platforms, databases, methodologies.
 
-Return a JSON array of 5-15 specific skills:
-{{"skills": ["skill1", "skill2", "skill3"]}}
+TASK 2 - Provide 3-5 SPECIFIC, ACTIONABLE improvement tips for the resume.
+Make tips specific, professional, and actionable.
+
+Return ONE JSON object with both results:
+{{"missing_skills": ["skill1", "skill2"], "improvement_tips": ["tip1", "tip2"]}}
 
-Focus on: programming languages, frameworks, tools, cloud platforms, databases, methodologies.
 Return ONLY the JSON, no other text.
 """
-        
+
         response = call_gemini_ai(prompt)
-        match = re.search(r'\{.*\}', response, re.DOTALL)
-        
-        if match:
-            data = json.loads(match.group(0))
-            skills = data.get("skills", [])
-            print(f"✅ Extracted {len(skills)} missing skills")
-            return skills[:15]
-        
-        return []
-        
+        data = _parse_json_object(response)
+
+        if data is not None:
+            skills = data.get("missing_skills", [])
+            log.debug("✅ Extracted %s missing skills", len(skills))
+            return {
+                "missing_skills": skills[:15],
+                "improvement_tips": data.get("improvement_tips", [])[:5]
+            }
+
+        return {"missing_skills": [], "improvement_tips": []}
+
     except Exception as e:
-        print(f"❌ Error extracting skills: {str(e)}")
-        return []
+        log.error("❌ Error analyzing gaps: %s", str(e))
+        return {"missing_skills": [], "improvement_tips": []}
+
+
+def extract_missing_skills(resume_text: str, jd_text: str, before_metrics: dict) -> list:
+    """Extract missing skills from JD that aren't in resume
+
+    Callers that also want improvement tips should use analyze_gaps
+    directly - pairing this with generate_improvement_tips still issues
+    two Gemini calls, so the fusion saving only materializes there.
+    """
+    return analyze_gaps(resume_text, jd_text, before_metrics)["missing_skills"]
 
 
 def generate_improvement_tips(before_metrics: dict) -> list:
-    """Generate improvement tips based on analysis"""
+    """Generate improvement tips based on analysis
+
+    Keeps its own tips-only prompt: this wrapper has no resume or JD
+    text to forward, so delegating to the fused analyze_gaps would send
+    that prompt's RESUME and JOB DESCRIPTION sections empty - strictly
+    worse input than a prompt that never asked for them.
+    """
     try:
         missing_chunks = before_metrics.get("missing_chunks", [])
-        
         if not missing_chunks:
             return []
-        
-        missing_text = " ".join(missing_chunks[:5])
-        
+
+        missing_text = _join_capped(missing_chunks[:5], 2000)
+
         prompt = f"""
 Based on this gap analysis, provide 3-5 SPECIFIC, ACTIONABLE improvement tips for the resume.
 
@@ -254,22 +337,30 @@ Return a JSON array:
 Make tips specific, professional, and actionable.
 Return ONLY the JSON, no other text.
 """
-        
+
         response = call_gemini_ai(prompt)
-        match = re.search(r'\{.*\}', response, re.DOTALL)
-        
-        if match:
-            data = json.loads(match.group(0))
-            tips = data.get("tips", [])
-            return tips[:5]
-        
+        data = _parse_json_object(response)
+
+        if data is not None:
+            return data.get("tips", [])[:5]
+
         return []
-        
+
     except Exception as e:
-        print(f"❌ Error generating tips: {str(e)}")
+        log.error("❌ Error generating tips: %s", str(e))
         return []
 
 
+async def extract_missing_skills_async(resume_text: str, jd_text: str, before_metrics: dict) -> list:
+    """Async wrapper so endpoints can overlap this with other Gemini calls"""
+    return await asyncio.to_thread(extract_missing_skills, resume_text, jd_text, before_metrics)
+
+
+async def generate_improvement_tips_async(before_metrics: dict) -> list:
+    """Async wrapper so endpoints can overlap this with other Gemini calls"""
+    return await asyncio.to_thread(generate_improvement_tips, before_metrics)
+
+
 # ============================================
 # LEGACY FUNCTION - Keep for text output
 # ============================================
@@ -292,7 +383,7 @@ def optimize_resume_with_selected_skills(resume_text: str, jd_text: str, before_
         }
         
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        log.error("❌ Error: %s", str(e))
         return {
             "optimized_resume_text": resume_text,
             "added_skills": selected_skills,
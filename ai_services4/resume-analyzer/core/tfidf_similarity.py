@@ -3,11 +3,27 @@ TF-IDF based similarity matching - CPU optimized
 Replaces heavy SentenceTransformers with lightweight TF-IDF + Cosine Similarity
 """
 
+import functools
+import hashlib
+import re
+
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.metrics.pairwise import linear_kernel
 from typing import List, Dict, Tuple
 
+# Same tokenization as the vectorizer, for building n-gram presence sets
+_TOKEN_RE = re.compile(r'(?u)\b\w+\b')
+
+# Hashed count rows keyed by text digest. Hashing is vocabulary-free, so a
+# text's row never changes - repeated documents (the same resume scored
+# against several JDs) skip tokenization entirely. IDF weighting still
+# happens per corpus on top of the cached counts.
+_count_row_cache = {}
+_COUNT_ROW_CACHE_MAX = 1024
+
 class TFIDFSimilarityEngine:
     """
     CPU-optimized similarity matching using TF-IDF + Cosine Similarity
@@ -18,23 +34,78 @@ class TFIDFSimilarityEngine:
     - 5-15% CPU usage vs 100% saturation
     """
     
-    def __init__(self, max_features: int = 1000, ngram_range: Tuple[int, int] = (1, 3)):
+    def __init__(self, max_features: int = 1000, ngram_range: Tuple[int, int] = (1, 3),
+                 stateless: bool = False):
         """
         Initialize TF-IDF vectorizer
-        
+
         Args:
             max_features: Maximum number of features (vocabulary size)
             ngram_range: Range of n-grams to consider (1,3) = unigrams, bigrams, trigrams
+            stateless: Use a HashingVectorizer instead of building a vocabulary.
+                Tokens are hashed straight into feature columns, so there is no
+                vocabulary dict to construct and no feature names - faster for
+                throwaway per-request fits, but compute_match_score needs the
+                default (stateful) mode to report keywords.
         """
-        self.vectorizer = TfidfVectorizer(
-            max_features=max_features,
-            ngram_range=ngram_range,
-            stop_words=None,  # Don't remove stop words - preprocessing already handles this
-            lowercase=True,
-            strip_accents='unicode',
-            min_df=1,  # Minimum document frequency
-            token_pattern=r'(?u)\b\w+\b'  # Keep all words including single characters
-        )
+        self.stateless = stateless
+        if stateless:
+            self.vectorizer = HashingVectorizer(
+                n_features=2 ** 14,
+                ngram_range=ngram_range,
+                alternate_sign=False,
+                lowercase=True,
+                strip_accents='unicode',
+                norm=None,  # raw counts - the TfidfTransformer normalizes
+                dtype=np.float32,  # halves value-array bytes; matmuls are memory-bound
+                token_pattern=r'(?u)\b\w+\b'
+            )
+            assert TfidfTransformer().norm == 'l2'
+        else:
+            self.vectorizer = TfidfVectorizer(
+                max_features=max_features,
+                ngram_range=ngram_range,
+                stop_words=None,  # Don't remove stop words - preprocessing already handles this
+                lowercase=True,
+                strip_accents='unicode',
+                min_df=1,  # Minimum document frequency
+                sublinear_tf=True,  # 1+log(tf) flattens term-frequency saturation
+                dtype=np.float32,  # halves value-array bytes; matmuls are memory-bound
+                token_pattern=r'(?u)\b\w+\b'  # Keep all words including single characters
+            )
+            # Every similarity here is a bare sparse dot product, which equals
+            # cosine only while the vectorizer keeps l2-normalizing its rows
+            assert self.vectorizer.norm == 'l2'
+
+    def fit_transform(self, texts: List[str]):
+        """Vectorize texts into l2-normalized TF-IDF rows via whichever path
+        this engine was built with."""
+        if self.stateless:
+            # Fresh transformer per call: IDF is corpus state, and keeping
+            # it off the engine leaves the stateless singleton free of
+            # mutable fit state (safe to share across pool threads)
+            return TfidfTransformer(sublinear_tf=True).fit_transform(
+                self._hashed_counts(texts))
+        return self.vectorizer.fit_transform(texts)
+
+    def _hashed_counts(self, texts: List[str]):
+        """Hashed count rows for texts, memoized per document so repeated
+        texts are not re-tokenized. Cache misses are transformed in one
+        batch to keep the vectorizer's C-level loop."""
+        keys = [hashlib.blake2b(t.encode('utf-8'), digest_size=16).digest()
+                for t in texts]
+        # Collect locally so bounded eviction can't drop a row this same
+        # call still needs for the final vstack
+        rows_by_key = {k: _count_row_cache[k] for k in keys if k in _count_row_cache}
+        miss_indices = [i for i, k in enumerate(keys) if keys[i] not in rows_by_key]
+        if miss_indices:
+            miss_rows = self.vectorizer.transform([texts[i] for i in miss_indices])
+            for pos, i in enumerate(miss_indices):
+                rows_by_key[keys[i]] = miss_rows[pos]
+                if len(_count_row_cache) >= _COUNT_ROW_CACHE_MAX:
+                    _count_row_cache.pop(next(iter(_count_row_cache)))
+                _count_row_cache[keys[i]] = miss_rows[pos]
+        return sparse.vstack([rows_by_key[k] for k in keys])
     
     def compute_similarity(self, text1: str, text2: str) -> float:
         """
@@ -50,10 +121,11 @@ class TFIDFSimilarityEngine:
         try:
             # Create TF-IDF vectors
             vectors = self.vectorizer.fit_transform([text1, text2])
-            
-            # Compute cosine similarity
-            similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
-            
+
+            # TF-IDF rows are l2-normalized, so the sparse dot product is the
+            # cosine similarity - no densification, C-level over nonzeros only
+            similarity = linear_kernel(vectors[0:1], vectors[1:2])[0][0]
+
             return float(similarity)
         except Exception as e:
             print(f"Error computing similarity: {e}")
@@ -75,14 +147,38 @@ class TFIDFSimilarityEngine:
             all_texts = [text1] + texts
             vectors = self.vectorizer.fit_transform(all_texts)
             
-            # Compute similarities against first text
-            similarities = cosine_similarity(vectors[0:1], vectors[1:])[0]
+            # Compute similarities against first text (sparse dot product)
+            similarities = linear_kernel(vectors[0:1], vectors[1:])[0]
             
             return similarities.tolist()
         except Exception as e:
             print(f"Error computing batch similarity: {e}")
             return [0.0] * len(texts)
     
+    def compute_many(self, jd_text: str, resume_texts: List[str]) -> np.ndarray:
+        """
+        Score many resumes against one JD with a single fit
+
+        Batch screening via compute_similarity refits the vocabulary per
+        pair; this fits once on all documents and computes every score as
+        one sparse matrix product.
+
+        Args:
+            jd_text: Job description text
+            resume_texts: Resumes to score against it
+
+        Returns:
+            Array of similarity scores, one per resume
+        """
+        if not resume_texts:
+            return np.zeros(0, dtype=np.float32)
+        try:
+            vectors = self.fit_transform([jd_text] + resume_texts)
+            return linear_kernel(vectors[0:1], vectors[1:])[0]
+        except Exception as e:
+            print(f"Error computing batch scores: {e}")
+            return np.zeros(len(resume_texts), dtype=np.float32)
+
     def compute_match_score(self, resume_text: str, jd_text: str) -> Dict:
         """
         Compute comprehensive match score with additional metrics
@@ -94,21 +190,37 @@ class TFIDFSimilarityEngine:
         Returns:
             Dictionary with match score and analysis
         """
-        # Compute similarity
-        similarity = self.compute_similarity(resume_text, jd_text)
-        
-        # Extract keywords from JD
-        jd_vectors = self.vectorizer.fit_transform([jd_text])
-        feature_names = self.vectorizer.get_feature_names_out()
-        jd_scores = jd_vectors.toarray()[0]
-        
-        # Get top keywords from JD
-        top_indices = np.argsort(jd_scores)[::-1][:20]
-        jd_keywords = [feature_names[i] for i in top_indices if jd_scores[i] > 0]
+        # Per-call vectorizer: this method runs on the shared CPU pool, and
+        # fit_transform + get_feature_names_out write then read fit state -
+        # on the shared instance two concurrent requests could interleave a
+        # fit with the other's keyword read. clone() copies only the params.
+        vectorizer = clone(self.vectorizer)
+
+        # Vectorize once - the same fit serves both the similarity score and
+        # the JD keyword analysis instead of re-fitting per step
+        vectors = vectorizer.fit_transform([resume_text, jd_text])
+        similarity = float(linear_kernel(vectors[0:1], vectors[1:2])[0][0])
+
+        # Extract keywords from JD (second row of the fitted matrix)
+        feature_names = vectorizer.get_feature_names_out()
+        jd_scores = vectors[1].toarray()[0]
+
+        # Top 20 keywords via O(V) argpartition instead of a full O(V log V)
+        # argsort of the vocabulary; only the 20 survivors get sorted
+        k = min(20, len(jd_scores))
+        top_indices = np.argpartition(jd_scores, -k)[-k:] if k else np.array([], dtype=int)
+        top_indices = top_indices[np.argsort(jd_scores[top_indices])[::-1]]
+        top_indices = top_indices[jd_scores[top_indices] > 0]
+        jd_keywords = [feature_names[i] for i in top_indices]
         
-        # Check keyword presence in resume
-        resume_lower = resume_text.lower()
-        matched_keywords = [kw for kw in jd_keywords if kw in resume_lower]
+        # Check keyword presence against the resume's 1/2/3-gram set - hash
+        # lookups instead of substring scans, and no false hits from short
+        # keywords matching inside longer words ("ai" in "maintain")
+        tokens = _TOKEN_RE.findall(resume_text.lower())
+        resume_grams = set(tokens)
+        resume_grams.update(map(' '.join, zip(tokens, tokens[1:])))
+        resume_grams.update(map(' '.join, zip(tokens, tokens[1:], tokens[2:])))
+        matched_keywords = [kw for kw in jd_keywords if kw in resume_grams]
         
         keyword_coverage = len(matched_keywords) / len(jd_keywords) if jd_keywords else 0
         
@@ -123,6 +235,14 @@ class TFIDFSimilarityEngine:
         }
 
 
+@functools.lru_cache(maxsize=1)
+def _default_stateless_engine() -> TFIDFSimilarityEngine:
+    """Shared stateless engine - constructing one per call re-ran sklearn's
+    parameter validation and token-pattern compilation. HashingVectorizer
+    holds no fit state, so the instance is safe across pool threads."""
+    return TFIDFSimilarityEngine(stateless=True)
+
+
 def chunk_text(text: str, chunk_size: int = 150) -> List[str]:
     """
     Split text into chunks for granular analysis
@@ -134,12 +254,10 @@ def chunk_text(text: str, chunk_size: int = 150) -> List[str]:
     Returns:
         List of text chunks
     """
+    # List comprehension over a plain loop: no per-iteration .append lookup,
+    # same shape as chunking_similarity.chunk_text
     words = text.split()
-    chunks = []
-    for i in range(0, len(words), chunk_size):
-        chunk = " ".join(words[i:i + chunk_size])
-        chunks.append(chunk)
-    return chunks
+    return [" ".join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
 
 
 def compute_chunk_similarity(resume_text: str, jd_text: str, chunk_size: int = 150) -> Dict:
@@ -157,28 +275,37 @@ def compute_chunk_similarity(resume_text: str, jd_text: str, chunk_size: int = 1
     # Create chunks
     resume_chunks = chunk_text(resume_text, chunk_size)
     jd_chunks = chunk_text(jd_text, chunk_size)
-    
-    # Compute similarity matrix
-    engine = TFIDFSimilarityEngine()
-    
-    # For each JD chunk, find best matching resume chunk
+
+    # One fit over every chunk, then one similarity matrix - refitting the
+    # vectorizer per JD chunk re-tokenized the resume len(jd_chunks) times.
+    # Stateless (hashing) mode: nothing here reads feature names, so skip
+    # building a vocabulary dict for this single-use fit.
+    engine = _default_stateless_engine()
     missing_chunks = []
     matched_chunks = []
-    
-    for jd_idx, jd_chunk in enumerate(jd_chunks):
-        similarities = engine.compute_batch_similarity(jd_chunk, resume_chunks)
-        max_similarity = max(similarities) if similarities else 0
-        
+
+    if resume_chunks and jd_chunks:
+        vectors = engine.fit_transform(resume_chunks + jd_chunks)
+        resume_matrix = vectors[:len(resume_chunks)]
+        jd_matrix = vectors[len(resume_chunks):]
+
+        # Best-matching resume chunk per JD chunk in one C-level pass
+        # (rows are l2-normalized, so the sparse dot product is the cosine)
+        max_similarities = linear_kernel(jd_matrix, resume_matrix).max(axis=1)
+    else:
+        max_similarities = [0.0] * len(jd_chunks)
+
+    for jd_idx, max_similarity in enumerate(max_similarities):
         if max_similarity < 0.3:  # Low threshold for missing content
             missing_chunks.append({
                 "chunk_index": jd_idx,
-                "content": jd_chunk[:100] + "...",  # Preview
-                "max_similarity": round(max_similarity, 3)
+                "content": jd_chunks[jd_idx][:100] + "...",  # Preview
+                "max_similarity": round(float(max_similarity), 3)
             })
         else:
             matched_chunks.append({
                 "chunk_index": jd_idx,
-                "max_similarity": round(max_similarity, 3)
+                "max_similarity": round(float(max_similarity), 3)
             })
     
     # Overall statistics
@@ -199,30 +326,34 @@ def compute_chunk_similarity(resume_text: str, jd_text: str, chunk_size: int = 1
 
 
 # Backward compatibility with existing code
-def get_embeddings(chunks: List[str]) -> np.ndarray:
+def get_embeddings(chunks: List[str]) -> sparse.csr_matrix:
     """
     Create TF-IDF vectors (backward compatible function name)
-    
+
     Args:
         chunks: List of text chunks
-    
+
     Returns:
-        TF-IDF matrix as numpy array
+        TF-IDF matrix as sparse CSR - ~95% of entries are zeros, so
+        densifying here multiplied memory for nothing. Callers that need
+        dense can .toarray() themselves.
     """
     engine = TFIDFSimilarityEngine()
-    vectors = engine.vectorizer.fit_transform(chunks)
-    return vectors.toarray()
+    return engine.vectorizer.fit_transform(chunks)
 
 
-def compute_similarity(resume_embeds: np.ndarray, jd_embeds: np.ndarray) -> np.ndarray:
+def compute_similarity(resume_embeds, jd_embeds) -> np.ndarray:
     """
     Compute cosine similarity matrix (backward compatible)
-    
+
     Args:
-        resume_embeds: Resume TF-IDF vectors
-        jd_embeds: JD TF-IDF vectors
-    
+        resume_embeds: Resume TF-IDF vectors (sparse or dense)
+        jd_embeds: JD TF-IDF vectors (sparse or dense)
+
     Returns:
-        Similarity matrix
+        Similarity matrix as a dense numpy array
     """
-    return cosine_similarity(resume_embeds, jd_embeds)
+    # TF-IDF rows are already unit-norm, so one product is the cosine
+    # matrix; sparse inputs stay sparse until the small result
+    sims = resume_embeds @ jd_embeds.T
+    return sims.toarray() if sparse.issparse(sims) else np.asarray(sims)
@@ -1,36 +1,133 @@
 # ai_services4/resume-analyzer/services/latex_pdf_generator.py
 
+import functools
+import hashlib
+import logging
+import re
 import subprocess
 import tempfile
+import threading
 import os
-import shutil
 from pathlib import Path
 from typing import Dict
 
+log = logging.getLogger(__name__)
+
+# Compiled PDFs keyed by SHA-256 of the LaTeX source - regenerating the
+# same resume (retry, re-download) becomes a file read instead of a
+# multi-second Tectonic run
+PDF_CACHE_DIR = Path("pdf_cache")
+PDF_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Shared Tectonic bundle cache - pin a stable path so the format file and
+# bundle metadata are fetched/parsed once per server lifetime rather than
+# rediscovered for every compile. Overridable via TECTONIC_CACHE_DIR (the
+# env var Tectonic itself reads); XDG_CACHE_HOME is set too for older
+# builds that predate it.
+TECTONIC_CACHE_DIR = os.environ.get('TECTONIC_CACHE_DIR') or os.path.join(
+    tempfile.gettempdir(), 'tectonic_cache')
+os.makedirs(TECTONIC_CACHE_DIR, exist_ok=True)
+_TECTONIC_ENV = {**os.environ,
+                 'TECTONIC_CACHE_DIR': TECTONIC_CACHE_DIR,
+                 'XDG_CACHE_HOME': TECTONIC_CACHE_DIR}
+
+# Cap concurrent Tectonic processes at the core count: requests compile in
+# parallel up to that limit without oversubscribing the CPU
+_tectonic_slots = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# Single-pass LaTeX escaping: one regex scan, and no chance of a later
+# replacement mangling the backslashes an earlier one inserted
+_LATEX_ESCAPES = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+}
+_LATEX_ESCAPE_RE = re.compile('|'.join(re.escape(c) for c in _LATEX_ESCAPES))
+
+
+def _evict_pdf_cache():
+    """Drop the oldest cached PDFs once the cache exceeds its size budget"""
+    try:
+        with os.scandir(PDF_CACHE_DIR) as it:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                       for e in it if e.name.endswith('.pdf')]
+    except FileNotFoundError:
+        return
+    total = sum(size for _, size, _ in entries)
+    if total <= PDF_CACHE_MAX_BYTES:
+        return
+    for _, size, path in sorted(entries):
+        try:
+            os.remove(path)
+            total -= size
+        except Exception as e:
+            log.warning("⚠️  Could not remove cached PDF %s: %s", path, e)
+        if total <= PDF_CACHE_MAX_BYTES:
+            break
+
+
+@functools.lru_cache(maxsize=1)
+def _tectonic_version() -> str:
+    """Verify Tectonic is installed, once per process.
+
+    The binary on PATH doesn't change while the server runs, so every
+    generator instance after the first reuses this answer instead of
+    spawning a `tectonic --version` subprocess.
+    """
+    try:
+        result = subprocess.run(
+            ['tectonic', '--version'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode != 0:
+            raise Exception("Tectonic not found")
+        return result.stdout.strip()
+    except Exception as e:
+        raise Exception(f"Tectonic compiler not available: {e}")
+
+
 class LaTeXPDFGenerator:
     """
     Generate PDF from resume data using LaTeX template and Tectonic compiler.
     """
-    
+
+    # Set once the bundle is known to be local; later compiles then run
+    # with --only-cached so a flaky network can't stall them
+    _bundle_warm = False
+
     def __init__(self):
         self.template_path = Path(__file__).parent.parent / 'templates' / 'resume_template.tex'
-        self._check_tectonic()
-    
-    def _check_tectonic(self):
-        """Verify Tectonic is installed."""
+        log.info("✅ Tectonic found: %s", _tectonic_version())
+        self._warm_bundle_cache()
+
+    def _warm_bundle_cache(self):
+        """Compile the real template's preamble once so the bundle cache is
+        populated at startup instead of on the first user request.
+
+        The warm-up must pull every package a resume compile needs
+        (fullpage, titlesec, hyperref, ...), so it reuses the template's
+        own preamble - a trivial article document would "warm" the cache
+        without fetching any of them.
+        """
+        if LaTeXPDFGenerator._bundle_warm:
+            return
         try:
-            result = subprocess.run(
-                ['tectonic', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
-                raise Exception("Tectonic not found")
-            print(f"✅ Tectonic found: {result.stdout.strip()}")
+            template = self.template_path.read_text(encoding='utf-8')
+            preamble = template.split('\\begin{document}', 1)[0]
+            self._compile_latex(preamble + "\\begin{document}.\\end{document}")
+            log.info("✅ Tectonic bundle cache warmed")
         except Exception as e:
-            raise Exception(f"Tectonic compiler not available: {e}")
-    
+            log.warning("⚠️  Tectonic warm-up compile failed: %s", e)
+
     def generate_pdf(self, resume_data: Dict) -> bytes:
         """
         Generate PDF from structured resume data.
@@ -51,9 +148,10 @@ class LaTeXPDFGenerator:
         # Fill template with data
         latex_content = self._populate_template(template, resume_data)
         
-        # Debug: print first 1000 chars
-        print("📄 LaTeX content preview:")
-        print(latex_content[:1000])
+        # Debug preview - guarded so the slice is never built unless
+        # debug logging is actually on
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("📄 LaTeX content preview:\n%s", latex_content[:1000])
         
         # Compile to PDF
         pdf_bytes = self._compile_latex(latex_content)
@@ -93,70 +191,48 @@ class LaTeXPDFGenerator:
     
     def _populate_template(self, template: str, data: Dict) -> str:
         """Replace template variables with actual data."""
-        
-        # Basic info
-        template = template.replace('{{NAME}}', self._escape_latex(data['name']))
-        template = template.replace('{{EMAIL}}', self._escape_latex(data['email']))
-        template = template.replace('{{PHONE}}', self._escape_latex(data['phone']))
-        template = template.replace('{{LOCATION}}', self._escape_latex(data['location']))
-        
-        # Links
-        github_link = data['github']
-        linkedin_link = data['linkedin']
-        template = template.replace('{{GITHUB_LINK}}', f"\\href{{{github_link}}}{{\\underline{{GitHub}}}}")
-        template = template.replace('{{LINKEDIN_LINK}}', f"\\href{{{linkedin_link}}}{{\\underline{{LinkedIn}}}}")
-        
-        # Summary
-        summary = self._escape_latex(data['summary']) if data['summary'] else 'Professional summary not provided'
-        template = template.replace('{{SUMMARY}}', summary)
-        
-        # Build sections
-        education_latex = self._build_education(data['education'])
-        skills_latex = self._build_skills(data['skills'])
-        projects_latex = self._build_projects(data['projects'])
-        experience_latex = self._build_experience(data['experience'])
-        certs_latex = self._build_certifications(data['certifications'])
-        
-        template = template.replace('{{EDUCATION_CONTENT}}', education_latex)
-        template = template.replace('{{SKILLS_CONTENT}}', skills_latex)
-        template = template.replace('{{PROJECTS_CONTENT}}', projects_latex)
-        template = template.replace('{{EXPERIENCE_CONTENT}}', experience_latex)
-        template = template.replace('{{CERTIFICATIONS_CONTENT}}', certs_latex)
-        
-        return template
+
+        # Every {{PLACEHOLDER}} resolved from one dict in a single regex
+        # pass - twelve sequential .replace calls each rescanned and
+        # reallocated the whole (growing) template
+        subs = {
+            'NAME': self._escape_latex(data['name']),
+            'EMAIL': self._escape_latex(data['email']),
+            'PHONE': self._escape_latex(data['phone']),
+            'LOCATION': self._escape_latex(data['location']),
+            'GITHUB_LINK': f"\\href{{{data['github']}}}{{\\underline{{GitHub}}}}",
+            'LINKEDIN_LINK': f"\\href{{{data['linkedin']}}}{{\\underline{{LinkedIn}}}}",
+            'SUMMARY': self._escape_latex(data['summary']) if data['summary'] else 'Professional summary not provided',
+            'EDUCATION_CONTENT': self._build_education(data['education']),
+            'SKILLS_CONTENT': self._build_skills(data['skills']),
+            'PROJECTS_CONTENT': self._build_projects(data['projects']),
+            'EXPERIENCE_CONTENT': self._build_experience(data['experience']),
+            'CERTIFICATIONS_CONTENT': self._build_certifications(data['certifications']),
+        }
+        return re.sub(r'\{\{(\w+)\}\}', lambda m: subs.get(m.group(1), m.group(0)), template)
     
     def _build_education(self, education_list: list) -> str:
         """Build education section in LaTeX."""
         if not education_list:
             return "\\resumeSubheading{Education not provided}{}{}{}"
         
-        items = []
-        for edu in education_list:
-            institution = self._escape_latex(edu.get('institution', ''))
-            location = self._escape_latex(edu.get('location', ''))
-            degree = self._escape_latex(edu.get('degree', ''))
-            dates = self._escape_latex(edu.get('dates', ''))
-            
-            items.append(f"""\\resumeSubheading
-      {{{institution}}}{{{location}}}
-      {{{degree}}}{{{dates}}}""")
-        
-        return '\n    '.join(items)
+        # One generator feeding a single join - no intermediate list growth
+        return '\n    '.join(
+            f"""\\resumeSubheading
+      {{{self._escape_latex(edu.get('institution', ''))}}}{{{self._escape_latex(edu.get('location', ''))}}}
+      {{{self._escape_latex(edu.get('degree', ''))}}}{{{self._escape_latex(edu.get('dates', ''))}}}"""
+            for edu in education_list)
     
     def _build_skills(self, skills: dict) -> str:
         """Build skills section in LaTeX."""
         if not skills:
             return "\\textbf{Skills}: Not specified \\\\"
         
-        items = []
-        for category, skill_list in skills.items():
-            if not skill_list:  # Skip empty categories
-                continue
-            skills_str = ', '.join(skill_list)
-            category_escaped = self._escape_latex(category)
-            skills_escaped = self._escape_latex(skills_str)
-            items.append(f"\\textbf{{{category_escaped}}}: {skills_escaped} \\\\")
-        
+        items = [
+            f"\\textbf{{{self._escape_latex(category)}}}: {self._escape_latex(', '.join(skill_list))} \\\\"
+            for category, skill_list in skills.items() if skill_list  # Skip empty categories
+        ]
+
         if not items:
             return "\\textbf{Skills}: Not specified \\\\"
         
@@ -171,21 +247,14 @@ class LaTeXPDFGenerator:
         for proj in projects:
             name = self._escape_latex(proj.get('name', 'Project'))
             link = proj.get('link', '#')
-            
+            bullets = [f"            \\resumeItem{{{self._escape_latex(b)}}}"
+                       for b in proj.get('bullets', [])]
             items.append(f"""\\resumeProjectHeading
           {{\\textbf{{{name}}} $|$ \\href{{{link}}}{{\\underline{{Link}}}}}}{{}}
           \\resumeItemListStart""")
-            
-            bullets = proj.get('bullets', [])
-            if not bullets:
-                items.append("    \\resumeItem{Project description not provided}")
-            else:
-                for bullet in bullets:
-                    bullet_escaped = self._escape_latex(bullet)
-                    items.append(f"            \\resumeItem{{{bullet_escaped}}}")
-            
+            items.extend(bullets or ["    \\resumeItem{Project description not provided}"])
             items.append("          \\resumeItemListEnd")
-        
+
         return '\n      '.join(items)
     
     def _build_experience(self, experience: list) -> str:
@@ -200,19 +269,13 @@ class LaTeXPDFGenerator:
             location = self._escape_latex(exp.get('location', ''))
             dates = self._escape_latex(exp.get('dates', ''))
             
+            bullets = [f"        \\resumeItem{{{self._escape_latex(b)}}}"
+                       for b in exp.get('bullets', [])]
             items.append(f"""\\resumeSubheading
       {{{title}}}{{{dates}}}
       {{{company}}}{{{location}}}
       \\resumeItemListStart""")
-            
-            bullets = exp.get('bullets', [])
-            if not bullets:
-                items.append("        \\resumeItem{Role description not provided}")
-            else:
-                for bullet in bullets:
-                    bullet_escaped = self._escape_latex(bullet)
-                    items.append(f"        \\resumeItem{{{bullet_escaped}}}")
-            
+            items.extend(bullets or ["        \\resumeItem{Role description not provided}"])
             items.append("      \\resumeItemListEnd")
         
         return '\n    '.join(items)
@@ -224,73 +287,77 @@ class LaTeXPDFGenerator:
             return ""
         
         # Join all certifications as a single resumeItem
-        certs_text = ' $\\cdot$ '.join([self._escape_latex(cert) for cert in certifications])
-        return certs_text
+        return ' $\\cdot$ '.join(self._escape_latex(cert) for cert in certifications)
     
     def _escape_latex(self, text: str) -> str:
         """Escape special LaTeX characters."""
         if not text:
             return ""
-        
-        # Convert to string if not already
-        text = str(text)
-        
-        replacements = {
-            '\\': r'\textbackslash{}',
-            '&': r'\&',
-            '%': r'\%',
-            '$': r'\$',
-            '#': r'\#',
-            '_': r'\_',
-            '{': r'\{',
-            '}': r'\}',
-            '~': r'\textasciitilde{}',
-            '^': r'\textasciicircum{}'
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        return text
+
+        # One C-level scan instead of ten sequential .replace passes; the
+        # old chain also re-escaped braces inserted by \textbackslash{}
+        return _LATEX_ESCAPE_RE.sub(lambda m: _LATEX_ESCAPES[m.group(0)], str(text))
     
     def _compile_latex(self, latex_content: str) -> bytes:
         """Compile LaTeX to PDF using Tectonic."""
+        # Content-addressed cache: identical source always compiles to the
+        # same PDF, so skip Tectonic entirely on a hit
+        key = hashlib.sha256(latex_content.encode()).hexdigest()
+        cache_file = PDF_CACHE_DIR / f"{key}.pdf"
+        if cache_file.exists():
+            log.debug("✅ Using cached PDF for LaTeX hash: %.8s...", key)
+            return cache_file.read_bytes()
+
         with tempfile.TemporaryDirectory() as tmpdir:
-            tex_file = os.path.join(tmpdir, 'resume.tex')
-            pdf_file = os.path.join(tmpdir, 'resume.pdf')
-            
-            # Write .tex file
-            with open(tex_file, 'w', encoding='utf-8') as f:
-                f.write(latex_content)
-            
-            print(f"📝 Compiling LaTeX in {tmpdir}")
-            
-            # Compile with Tectonic
-            result = subprocess.run(
-                ['tectonic', '-X', 'compile', tex_file, '--outdir', tmpdir],
-                capture_output=True,
-                text=True,
-                timeout=180,
-                cwd=tmpdir
-            )
-            
+            # Tectonic names stdin jobs "texput"
+            pdf_file = os.path.join(tmpdir, 'texput.pdf')
+
+            log.debug("📝 Compiling LaTeX in %s", tmpdir)
+
+            # Stream the source over stdin - no .tex write/fsync on the
+            # request path, only the produced PDF touches disk
+            def run_tectonic(cmd):
+                with _tectonic_slots:
+                    return subprocess.run(
+                        cmd,
+                        input=latex_content,
+                        capture_output=True,
+                        text=True,
+                        timeout=180,
+                        cwd=tmpdir,
+                        env=_TECTONIC_ENV
+                    )
+
+            cmd = ['tectonic', '-X', 'compile', '-', '--outdir', tmpdir]
+            only_cached = LaTeXPDFGenerator._bundle_warm
+            result = run_tectonic(cmd + ['--only-cached'] if only_cached else cmd)
+
+            if result.returncode != 0 and only_cached:
+                # A package the warm-up didn't pull shows up as a failure
+                # under --only-cached; self-heal by retrying once with
+                # network fetches allowed instead of failing permanently
+                log.warning("⚠️  --only-cached compile failed, retrying with bundle fetches allowed")
+                LaTeXPDFGenerator._bundle_warm = False
+                result = run_tectonic(cmd)
+
             if result.returncode != 0:
-                print(f"❌ LaTeX compilation failed:")
-                print(f"STDOUT: {result.stdout}")
-                print(f"STDERR: {result.stderr}")
-                
+                log.error("❌ LaTeX compilation failed:\nSTDOUT: %s\nSTDERR: %s",
+                          result.stdout, result.stderr)
+
                 # Save failed .tex for debugging (use Windows temp path)
                 debug_file = os.path.join(tempfile.gettempdir(), 'failed_resume.tex')
                 try:
-                    shutil.copy(tex_file, debug_file)
-                    print(f"💾 Failed .tex saved to: {debug_file}")
+                    with open(debug_file, 'w', encoding='utf-8') as f:
+                        f.write(latex_content)
+                    log.debug("💾 Failed .tex saved to: %s", debug_file)
                 except Exception as e:
-                    print(f"⚠️  Could not save debug file: {e}")
-                
+                    log.warning("⚠️  Could not save debug file: %s", e)
+
                 raise Exception(f"LaTeX compilation error: {result.stderr}")
             
-            print(f"✅ PDF compiled successfully")
-            
+            log.debug("✅ PDF compiled successfully")
+            LaTeXPDFGenerator._bundle_warm = True
+
             # Read PDF
             if not os.path.exists(pdf_file):
                 raise Exception("PDF file not generated")
@@ -298,8 +365,15 @@ class LaTeXPDFGenerator:
             with open(pdf_file, 'rb') as f:
                 pdf_bytes = f.read()
             
-            print(f"📄 PDF size: {len(pdf_bytes)} bytes")
-            
+            log.debug("📄 PDF size: %d bytes", len(pdf_bytes))
+
+            try:
+                PDF_CACHE_DIR.mkdir(exist_ok=True)
+                cache_file.write_bytes(pdf_bytes)
+                _evict_pdf_cache()
+            except Exception as e:
+                log.warning("⚠️  Could not cache compiled PDF: %s", e)
+
             return pdf_bytes
 
 
@@ -1,11 +1,38 @@
+import logging
+import re
+
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
+# One shared session: TCP/TLS handshakes with the compile service are paid
+# once per pooled connection instead of once per PDF
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+log = logging.getLogger(__name__)
+
+# Single-pass LaTeX escaping - the old sequential .replace chain ran the
+# backslash substitution last, mangling every escape inserted before it
+_LATEX_ESCAPES = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\^{}',
+}
+_LATEX_ESCAPE_RE = re.compile('|'.join(re.escape(c) for c in _LATEX_ESCAPES))
+
 class OnlineLaTeXGenerator:
     def __init__(self):
         # Correct LaTeX.Online API URL
         self.api_url = "https://latexonline.cc/compile"
-        print("✅ Online LaTeX generator initialized")
+        log.info("✅ Online LaTeX generator initialized")
     
     def generate_pdf(self, resume_data: dict) -> bytes:
         """Generate PDF using LaTeX.Online API"""
@@ -13,37 +40,29 @@ class OnlineLaTeXGenerator:
             # Generate LaTeX content
             latex_content = self._generate_latex(resume_data)
             
-            print("📤 Sending to LaTeX.Online...")
-            print(f"📝 LaTeX content length: {len(latex_content)} chars")
-            
-            # Correct API call - send as URL parameter
-            params = {
-                'url': f"data:application/x-latex;base64,{self._encode_latex(latex_content)}"
-            }
+            log.debug("📤 Sending to LaTeX.Online... (%d chars)", len(latex_content))
             
-            response = requests.get(
+            # POST the raw source as a file upload - no base64 inflation
+            # (33% extra bytes) and no URL length limit to worry about
+            response = _SESSION.post(
                 self.api_url,
-                params=params,
+                files={'file': ('resume.tex', latex_content.encode('utf-8'),
+                                'application/x-tex')},
                 timeout=30
             )
             
             if response.status_code == 200:
-                print(f"✅ PDF generated: {len(response.content)} bytes")
+                log.debug("✅ PDF generated: %d bytes", len(response.content))
                 return response.content
             else:
-                print(f"❌ API returned: {response.status_code}")
-                print(f"Response: {response.text[:200]}")
+                log.error("❌ API returned: %s\nResponse: %.200s",
+                          response.status_code, response.text)
                 raise Exception(f"LaTeX compilation failed: {response.status_code}")
                 
         except Exception as e:
-            print(f"❌ LaTeX generation error: {str(e)}")
+            log.error("❌ LaTeX generation error: %s", e)
             raise
     
-    def _encode_latex(self, latex: str) -> str:
-        """Base64 encode LaTeX content"""
-        import base64
-        return base64.b64encode(latex.encode('utf-8')).decode('utf-8')
-    
     def _generate_latex(self, data: dict) -> str:
         """Generate minimal LaTeX document"""
         
@@ -95,21 +114,5 @@ class OnlineLaTeXGenerator:
         """Escape special LaTeX characters"""
         if not text:
             return ""
-        
-        replacements = {
-            '&': r'\&',
-            '%': r'\%',
-            '$': r'\$',
-            '#': r'\#',
-            '_': r'\_',
-            '{': r'\{',
-            '}': r'\}',
-            '~': r'\textasciitilde{}',
-            '^': r'\^{}',
-            '\\': r'\textbackslash{}'
-        }
-        
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
-        
-        return text
\ No newline at end of file
+
+        return _LATEX_ESCAPE_RE.sub(lambda m: _LATEX_ESCAPES[m.group(0)], str(text))
\ No newline at end of file
@@ -1,42 +1,176 @@
 # ai_services4/resume-analyzer/services/pdf_generator.py
 
-from weasyprint import HTML, CSS
-from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from itertools import chain, islice
+import asyncio
+import functools
+import os
 import re
+import threading
 
-def generate_ats_resume_pdf(resume_text: str, candidate_name: str = "Resume") -> bytes:
-    """
-    Generate ATS-friendly PDF from optimized resume text.
-    Handles both well-formatted and poorly-formatted text.
-    """
-    
+# All patterns compiled once at import. The old code rebuilt them per call
+# (f-string pattern sources defeat re's internal cache by producing new
+# strings each invocation), re-running regex compilation per resume.
+_WS_RE = re.compile(r'[ \t]+')
+_BULLET_SPACE_RE = re.compile(r'•\s*')
+_BULLET_NL_RE = re.compile(r'([^\n])•')
+_PIPE_RE = re.compile(r'\s*\|\s*')
+_BLANKS_RE = re.compile(r'\n{3,}')
+
+SECTION_KEYWORDS = [
+    'SUMMARY', 'OBJECTIVE', 'EDUCATION', 'TECHNICAL SKILLS', 'SKILLS',
+    'EXPERIENCE', 'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE',
+    'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS', 'ADDITIONAL SKILLS'
+]
+# One alternation over all keywords, longest first so SKILLS can't
+# swallow TECHNICAL SKILLS - each header fix is a single scan of the text
+# instead of one scan per keyword
+_KW_ALT = '|'.join(sorted((re.escape(kw) for kw in SECTION_KEYWORDS),
+                          key=len, reverse=True))
+_HDR_BEFORE_RE = re.compile(rf'([^\n])({_KW_ALT})', re.IGNORECASE)
+_HDR_AFTER_RE = re.compile(rf'({_KW_ALT})([^\n:])', re.IGNORECASE)
+# Minimal covering subset for a cheap substring prefilter: keywords that
+# contain another keyword (TECHNICAL SKILLS ⊃ SKILLS) add nothing to an
+# "is any header present" check, so they're dropped. str.__contains__ is
+# far cheaper than running the alternation over keyword-free text.
+_KW_PREFILTER = tuple(
+    kw for kw in SECTION_KEYWORDS
+    if not any(other != kw and other in kw for other in SECTION_KEYWORDS))
+
+# One alternation classifying a line's section in a single match; the
+# winning named group is the canonical section title (matched against
+# upper-cased lines, keyword variations per branch)
+_SECTION_CLASSIFIER = re.compile(
+    r'(?P<SUMMARY>SUMMARY|OBJECTIVE|PROFILE|PROFESSIONAL\s+SUMMARY)'
+    r'|(?P<EDUCATION>EDUCATION|ACADEMIC|QUALIFICATIONS?)'
+    r'|(?P<SKILLS>TECHNICAL\s+SKILLS?|SKILLS?|COMPETENCIES|EXPERTISE)'
+    r'|(?P<EXPERIENCE>EXPERIENCE|WORK\s+EXPERIENCE|PROFESSIONAL\s+EXPERIENCE|EMPLOYMENT)'
+    r'|(?P<PROJECTS>PROJECTS?|PORTFOLIO)'
+    r'|(?P<CERTIFICATIONS>CERTIFICATIONS?|CERTIFICATES?|LICENSES?|ADDITIONAL\s+SKILLS?|AWARDS?)'
+)
+
+_DATE_RE = re.compile(r'20\d{2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec')
+# Sections whose subsections may be identified by a location alone
+_LOCATION_SECTIONS = frozenset(('EXPERIENCE', 'EDUCATION'))
+# Bullet prefixes stripped in one C-level pass; line[:1] membership is
+# a constant-time marker test (lines are pre-filtered non-empty)
+_BULLET_PREFIX_RE = re.compile(r'^[•\-*–\s]+')
+_BULLET_CHARS = '•-*–'
+# Date-or-location probe for EXPERIENCE/EDUCATION subsection detection -
+# one scan where separate date and location searches ran before
+_META_RE = re.compile(
+    r'20\d{2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+    r'|,\s*[A-Z]{2}|Remote|Pune|Mumbai|Bangalore|Delhi')
+
+# Single-pass HTML escaping: translate walks the string once with a table
+# lookup per character, where five chained .replace calls each rescan and
+# reallocate the whole string
+_HTML_ESC = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})
+
+# URLs and emails linkified in one alternation scan; which branch hit
+# decides the replacement
+_LINKIFY_RE = re.compile(
+    r'(?P<url>https?://[^\s<>"]+)'
+    r'|(?P<email>\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b)'
+)
+
+# The two profile-label rewrites run on the OUTPUT of the combined pass
+# (the GitHub one matches the anchor the URL branch just inserted), so
+# they stay separate substitutions - precompiled, and cheap because
+# contact lines are short
+_GITHUB_LABEL_RE = re.compile(r'GitHub\s*\|\s*<a href="(https://github\.com/[^"]+)">')
+_LINKEDIN_LABEL_RE = re.compile(r'LinkedIn\s*(?:\||$)')
+
+
+def _linkify_repl(m: re.Match) -> str:
+    target = m.group(0)
+    if m.lastgroup == 'email':
+        return f'<a href="mailto:{target}">{target}</a>'
+    return f'<a href="{target}">{target}</a>'
+
+
+def _linkedin_label_repl(m: re.Match) -> str:
+    tail = '|' if m.group(0)[-1] == '|' else ''
+    return f'<a href="https://linkedin.com/in/yourprofile">LinkedIn</a>{tail}'
+
+
+def _build_document(resume_text: str, candidate_name: str) -> str:
+    """Normalize, parse and assemble the full HTML document string."""
     # ✅ STEP 1: Clean and normalize the text first
     resume_text = normalize_resume_text(resume_text)
-    
+
     # ✅ STEP 2: Parse into structured sections
     sections = parse_resume_sections(resume_text)
-    
-    # ✅ STEP 3: Build semantic HTML
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <title>{candidate_name}</title>
-        {get_css()}
-    </head>
-    <body>
-        {build_html_body(sections)}
-    </body>
-    </html>
+
+    # ✅ STEP 3: Build semantic HTML around the precomputed skeleton. The
+    # whole document goes through one StringIO so the final string is
+    # materialized exactly once. The title is escaped - candidate_name
+    # used to land in <title> raw.
+    buf = StringIO()
+    buf.write(_HTML_PRE)
+    buf.write(escape_html(candidate_name))
+    buf.write(_HTML_MID)
+    build_html_body(buf, sections)
+    buf.write(_HTML_POST)
+    return buf.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def _weasyprint_runtime():
+    """Import WeasyPrint and build the shared font config plus parsed
+    stylesheet, once, on first render. The import drags in Cairo/Pango
+    bindings (~100ms) - deferring it keeps cold start fast for callers
+    that only want the text parser from this module."""
+    from weasyprint import HTML, CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    css_obj = CSS(string=_CSS_TEXT, font_config=font_config)
+    return HTML, css_obj, font_config
+
+
+def _render_html(html_content: str) -> bytes:
+    """Render an HTML document to PDF bytes (runs in pool workers too -
+    takes and returns only picklable values)."""
+    HTML, css_obj, font_config = _weasyprint_runtime()
+    # No target: write_pdf returns the bytes directly, skipping the
+    # BytesIO buffer plus getvalue() copy of the whole document
+    return HTML(string=html_content).write_pdf(
+        stylesheets=[css_obj], font_config=font_config)
+
+
+def generate_ats_resume_pdf(resume_text: str, candidate_name: str = "Resume") -> bytes:
     """
-    
-    # Generate PDF
-    pdf_buffer = BytesIO()
-    HTML(string=html_content).write_pdf(pdf_buffer)
-    pdf_buffer.seek(0)
-    
-    return pdf_buffer.getvalue()
+    Generate ATS-friendly PDF from optimized resume text.
+    Handles both well-formatted and poorly-formatted text.
+    """
+    return _render_html(_build_document(resume_text, candidate_name))
+
+
+# WeasyPrint holds the GIL through Cairo/Pango layout, so rendering in the
+# server process stalls every concurrent request. The async variant ships
+# the built HTML to a process pool; each worker builds its own WeasyPrint
+# runtime (import, font config, parsed CSS) on its first render.
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global _render_pool
+    if _render_pool is None:
+        with _render_pool_lock:
+            if _render_pool is None:
+                _render_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _render_pool
+
+
+async def generate_ats_resume_pdf_async(resume_text: str, candidate_name: str = "Resume") -> bytes:
+    """Async variant: parse in-process, render in a pool worker."""
+    html_content = _build_document(resume_text, candidate_name)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_render_pool(), _render_html, html_content)
 
 
 def normalize_resume_text(text: str) -> str:
@@ -45,31 +179,27 @@ def normalize_resume_text(text: str) -> str:
     Fixes common formatting issues from AI-generated text.
     """
     # Remove excessive whitespace
-    text = re.sub(r'[ \t]+', ' ', text)
-    
-    # Fix section headers - ensure they're on separate lines
-    section_keywords = [
-        'SUMMARY', 'OBJECTIVE', 'EDUCATION', 'TECHNICAL SKILLS', 'SKILLS',
-        'EXPERIENCE', 'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE',
-        'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS', 'ADDITIONAL SKILLS'
-    ]
-    
-    for keyword in section_keywords:
-        # Add newlines before section headers
-        text = re.sub(f'([^\n]){keyword}', f'\\1\n\n{keyword}', text, flags=re.IGNORECASE)
-        # Add newline after section header if not present
-        text = re.sub(f'{keyword}([^\n:])', f'{keyword}\n\\1', text, flags=re.IGNORECASE)
-    
+    text = _WS_RE.sub(' ', text)
+
+    # Fix section headers - ensure they're on separate lines. Headers are
+    # upper-cased in the replacement, as the old per-keyword loop did.
+    # Both passes can only fire when a keyword is present, so a substring
+    # scan short-circuits them for text without any section headers.
+    up = text.upper()
+    if any(kw in up for kw in _KW_PREFILTER):
+        text = _HDR_BEFORE_RE.sub(lambda m: f'{m.group(1)}\n\n{m.group(2).upper()}', text)
+        text = _HDR_AFTER_RE.sub(lambda m: f'{m.group(1).upper()}\n{m.group(2)}', text)
+
     # Fix bullet points - ensure proper spacing
-    text = re.sub(r'•\s*', '• ', text)
-    text = re.sub(r'([^\n])•', r'\1\n•', text)
-    
+    text = _BULLET_SPACE_RE.sub('• ', text)
+    text = _BULLET_NL_RE.sub(r'\1\n•', text)
+
     # Fix pipes (used for separating contact info)
-    text = re.sub(r'\s*\|\s*', ' | ', text)
-    
+    text = _PIPE_RE.sub(' | ', text)
+
     # Remove multiple consecutive blank lines
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
+    text = _BLANKS_RE.sub('\n\n', text)
+
     return text.strip()
 
 
@@ -77,8 +207,13 @@ def parse_resume_sections(text: str) -> dict:
     """
     Parse resume text into structured sections.
     Handles messy, unformatted text from AI.
+
+    Section content items are tagged sequences dispatched by their first
+    element: ['sub', title, meta, items], ('bullet', text), ('para', text).
     """
-    lines = [l.strip() for l in text.split('\n') if l.strip()]
+    # splitlines handles \r\n too, and the walrus strips each line once
+    # instead of twice (filter and value)
+    lines = [s for l in text.splitlines() if (s := l.strip())]
     
     if not lines:
         return {'header': [], 'sections': []}
@@ -90,33 +225,25 @@ def parse_resume_sections(text: str) -> dict:
     
     current_section = None
     current_subsection = None
-    
-    # Section keywords with variations
-    section_patterns = {
-        'SUMMARY': r'(SUMMARY|OBJECTIVE|PROFILE|PROFESSIONAL\s+SUMMARY)',
-        'EDUCATION': r'(EDUCATION|ACADEMIC|QUALIFICATIONS?)',
-        'SKILLS': r'(TECHNICAL\s+SKILLS?|SKILLS?|COMPETENCIES|EXPERTISE)',
-        'EXPERIENCE': r'(EXPERIENCE|WORK\s+EXPERIENCE|PROFESSIONAL\s+EXPERIENCE|EMPLOYMENT)',
-        'PROJECTS': r'(PROJECTS?|PORTFOLIO)',
-        'CERTIFICATIONS': r'(CERTIFICATIONS?|CERTIFICATES?|LICENSES?|ADDITIONAL\s+SKILLS?|AWARDS?)'
-    }
-    
+
     header_collected = False
     
-    for i, line in enumerate(lines):
-        line_upper = line.upper()
-        
-        # Check if this is a section header
-        is_section_header = False
+    # Pair each line with its successor up front - the subsection probe
+    # reads one line ahead, and zip beats a bounds-checked lines[i + 1]
+    # subscript per iteration
+    for line, next_line in zip(lines, chain(islice(lines, 1, None), ('',))):
+        is_bullet = line[:1] in _BULLET_CHARS
+
+        # Check if this is a section header - one classifier match instead
+        # of probing six patterns; bullet lines skip the regex entirely
+        # (and a bullet mentioning EXPERIENCE no longer opens a section)
         matched_section = None
-        
-        for section_name, pattern in section_patterns.items():
-            if re.match(f'^{pattern}$', line_upper.strip(':')) or re.search(pattern, line_upper):
-                is_section_header = True
-                matched_section = section_name
-                break
-        
-        if is_section_header and matched_section:
+        if not is_bullet:
+            m = _SECTION_CLASSIFIER.search(line.upper())
+            if m:
+                matched_section = m.lastgroup
+
+        if matched_section:
             header_collected = True
             current_section = {
                 'title': matched_section,
@@ -139,166 +266,138 @@ def parse_resume_sections(text: str) -> dict:
         
         # Detect subsections (job titles, project names, institution names)
         is_subsection = False
-        if not line.startswith(('•', '-', '*', '–')) and len(line) < 120:
-            # Check if next line might be metadata (dates, location)
-            next_line = lines[i + 1] if i + 1 < len(lines) else ''
-            
-            # Common patterns for subsection headers
-            has_date_pattern = bool(re.search(r'20\d{2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec', line + ' ' + next_line))
-            has_pipe = '|' in line or '|' in next_line
-            has_location = bool(re.search(r',\s*[A-Z]{2}|Remote|Pune|Mumbai|Bangalore|Delhi', line + ' ' + next_line))
-            
-            if has_date_pattern or has_pipe or (has_location and current_section['title'] in ['EXPERIENCE', 'EDUCATION']):
+        if not is_bullet and len(line) < 120:
+            # Check if next line might be metadata (dates, location) -
+            # concatenate the pair once and run every probe against it
+            probe = line + ' ' + next_line if next_line else line
+
+            # Common patterns for subsection headers: dates count anywhere,
+            # locations only inside experience/education
+            if current_section['title'] in _LOCATION_SECTIONS:
+                has_meta = bool(_META_RE.search(probe))
+            else:
+                has_meta = bool(_DATE_RE.search(probe))
+
+            if has_meta or '|' in probe:
                 is_subsection = True
-        
+
         if is_subsection:
-            current_subsection = {
-                'title': line,
-                'meta': '',
-                'items': []
-            }
+            # Tagged list: [kind, title, meta, items] - meta and items are
+            # filled in by later lines
+            current_subsection = ['sub', line, '', []]
             current_section['content'].append(current_subsection)
             continue
-        
+
         # Bullet points
-        if line.startswith(('•', '-', '*', '–')):
-            content = line.lstrip('•-*– ').strip()
+        if is_bullet:
+            content = _BULLET_PREFIX_RE.sub('', line).rstrip()
             if current_subsection:
-                current_subsection['items'].append(content)
+                current_subsection[3].append(content)
             else:
-                current_section['content'].append({'bullet': content})
+                current_section['content'].append(('bullet', content))
         # Regular text
         else:
             # If it looks like metadata for the previous subsection
-            if current_subsection and not current_subsection['meta']:
-                current_subsection['meta'] = line
+            if current_subsection and not current_subsection[2]:
+                current_subsection[2] = line
             else:
-                current_section['content'].append({'text': line})
+                current_section['content'].append(('para', line))
     
     return sections
 
 
-def build_html_body(sections: dict) -> str:
-    """Build HTML body from parsed sections with clickable links"""
-    html_parts = []
-    
+def build_html_body(buf: StringIO, sections: dict) -> None:
+    """Write the HTML body for parsed sections into the caller's buffer"""
+    # Writing into the document's own StringIO means the body is never
+    # materialized as a separate intermediate string
+
     # Header section
     if sections['header']:
-        html_parts.append('<div class="header">')
-        
+        buf.write('<div class="header">\n')
+
         # First line is usually the name
-        if sections['header']:
-            name = sections['header'][0]
-            html_parts.append(f'<h1>{escape_html(name)}</h1>')
-        
+        name = sections['header'][0]
+        buf.write(f'<h1>{escape_html(name)}</h1>\n')
+
         # Rest is contact info - make links clickable
         if len(sections['header']) > 1:
-            html_parts.append('<div class="contact">')
+            buf.write('<div class="contact">\n')
             contact_lines = sections['header'][1:]
-            
+
             for line in contact_lines:
                 # Convert URLs to clickable links
-                line_with_links = make_links_clickable(line)
-                html_parts.append(line_with_links)
+                buf.write(make_links_clickable(line))
+                buf.write('\n')
                 if line != contact_lines[-1]:
-                    html_parts.append(' ')
-            
-            html_parts.append('</div>')
-        
-        html_parts.append('</div>')
-    
+                    buf.write(' \n')
+
+            buf.write('</div>\n')
+
+        buf.write('</div>\n')
+
     # Content sections
     for section in sections['sections']:
-        html_parts.append('<div class="section">')
-        html_parts.append(f'<h2>{escape_html(section["title"])}</h2>')
-        
+        buf.write('<div class="section">\n')
+        buf.write(f'<h2>{escape_html(section["title"])}</h2>\n')
+
         for item in section['content']:
-            if isinstance(item, dict):
-                # Subsection (job, project, education entry)
-                if 'title' in item:
-                    html_parts.append('<div class="subsection">')
-                    # Make project links clickable
-                    title_with_links = make_links_clickable(item["title"])
-                    html_parts.append(f'<h3>{title_with_links}</h3>')
-                    
-                    if item.get('meta'):
-                        html_parts.append(f'<div class="meta">{escape_html(item["meta"])}</div>')
-                    
-                    if item.get('items'):
-                        html_parts.append('<ul>')
-                        for bullet in item['items']:
-                            html_parts.append(f'<li>{escape_html(bullet)}</li>')
-                        html_parts.append('</ul>')
-                    
-                    html_parts.append('</div>')
-                
-                # Standalone bullet
-                elif 'bullet' in item:
-                    html_parts.append('<ul>')
-                    html_parts.append(f'<li>{escape_html(item["bullet"])}</li>')
-                    html_parts.append('</ul>')
-                
-                # Regular paragraph
-                elif 'text' in item:
-                    html_parts.append(f'<p>{escape_html(item["text"])}</p>')
-        
-        html_parts.append('</div>')
-    
-    return '\n'.join(html_parts)
+            # Tag dispatch: one dict lookup per item replaces the old
+            # isinstance plus three key-presence probes
+            _RENDERERS[item[0]](buf, item)
+
+        buf.write('</div>\n')
+
+
+def _render_subsection(buf: StringIO, item) -> None:
+    """Render a job/project/education entry"""
+    _, title, meta, items = item
+    buf.write('<div class="subsection">\n')
+    # Make project links clickable
+    buf.write(f'<h3>{make_links_clickable(title)}</h3>\n')
+
+    if meta:
+        buf.write(f'<div class="meta">{escape_html(meta)}</div>\n')
+
+    if items:
+        buf.write('<ul>\n')
+        for bullet in items:
+            buf.write(f'<li>{escape_html(bullet)}</li>\n')
+        buf.write('</ul>\n')
+
+    buf.write('</div>\n')
+
+
+def _render_bullet(buf: StringIO, item) -> None:
+    """Render a standalone bullet"""
+    buf.write(f'<ul>\n<li>{escape_html(item[1])}</li>\n</ul>\n')
+
+
+def _render_paragraph(buf: StringIO, item) -> None:
+    """Render a regular paragraph"""
+    buf.write(f'<p>{escape_html(item[1])}</p>\n')
+
+
+_RENDERERS = {'sub': _render_subsection, 'bullet': _render_bullet, 'para': _render_paragraph}
 
 
 def make_links_clickable(text: str) -> str:
-    """Convert URLs and common link patterns to clickable HTML links"""
+    """Convert URLs, emails and profile labels to clickable HTML links"""
     if not text:
         return ""
-    
-    # Pattern 1: Full URLs (https://github.com/username)
-    text = re.sub(
-        r'(https?://[^\s<>"]+)',
-        r'<a href="\1">\1</a>',
-        text
-    )
-    
-    # Pattern 2: Email addresses
-    text = re.sub(
-        r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b',
-        r'<a href="mailto:\1">\1</a>',
-        text
-    )
-    
-    # Pattern 3: "GitHub" text near URL
-    text = re.sub(
-        r'GitHub\s*\|\s*<a href="(https://github\.com/[^"]+)">',
-        r'<a href="\1">GitHub</a> | <a href="',
-        text
-    )
-    
-    # Pattern 4: "LinkedIn" text near URL
-    text = re.sub(
-        r'LinkedIn\s*(?:\||$)',
-        lambda m: f'<a href="https://linkedin.com/in/yourprofile">LinkedIn</a>{m.group(0)[-1] if m.group(0)[-1] == "|" else ""}',
-        text
-    )
-    
-    return text
+    text = _LINKIFY_RE.sub(_linkify_repl, text)
+    # Label rewrites depend on the anchors inserted above
+    text = _GITHUB_LABEL_RE.sub(r'<a href="\1">GitHub</a> | <a href="', text)
+    return _LINKEDIN_LABEL_RE.sub(_linkedin_label_repl, text)
 
 
 def escape_html(text: str) -> str:
     """Escape HTML special characters"""
-    if not text:
-        return ""
-    return (text
-            .replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-            .replace("'", '&#39;'))
+    return text.translate(_HTML_ESC) if text else ""
 
 
-def get_css() -> str:
-    """Return embedded CSS for professional ATS-friendly formatting"""
-    return """
-    <style>
+# Raw stylesheet for professional ATS-friendly formatting; parsed once
+# into _CSS_OBJ below instead of travelling inline through the HTML
+_CSS_TEXT = """
         @page {
             size: A4;
             margin: 0.75in;
@@ -406,9 +505,22 @@ def get_css() -> str:
                 font-size: 10.5pt;
             }
         }
-    </style>
     """
 
 
+def get_css() -> str:
+    """Return embedded CSS for professional ATS-friendly formatting"""
+    return f'<style>{_CSS_TEXT}</style>'
+
+
+# Static document skeleton, assembled once at import. Only the title and
+# body vary per resume; the stylesheet goes to write_pdf pre-parsed by
+# _weasyprint_runtime.
+_HTML_PRE = ('<!DOCTYPE html>\n<html lang="en">\n<head>\n'
+             '<meta charset="UTF-8">\n<title>')
+_HTML_MID = '</title>\n</head>\n<body>\n'
+_HTML_POST = '\n</body>\n</html>\n'
+
+
 # Export
-__all__ = ['generate_ats_resume_pdf', 'parse_resume_sections']
\ No newline at end of file
+__all__ = ['generate_ats_resume_pdf', 'generate_ats_resume_pdf_async', 'parse_resume_sections']
\ No newline at end of file
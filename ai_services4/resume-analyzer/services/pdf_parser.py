@@ -6,20 +6,24 @@ import fitz  # PyMuPDF
 def extract_text_from_pdf(pdf_file) -> str:
     """Extract text from uploaded PDF file"""
     try:
-        # Read PDF bytes
-        pdf_bytes = pdf_file.file.read()
-        
-        # Open PDF with PyMuPDF
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        
-        # Extract text from all pages
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        
-        doc.close()
-        
-        return text
+        upload = pdf_file.file
+        upload.seek(0)
+
+        # Large uploads roll over to a real temp file; hand MuPDF the path
+        # so it reads pages incrementally instead of copying the whole PDF
+        # into a bytes object first. Small uploads stay in memory.
+        name = getattr(upload, "name", None)
+        if getattr(upload, "_rolled", False) and isinstance(name, str):
+            doc = fitz.open(name, filetype="pdf")
+        else:
+            doc = fitz.open(stream=upload.read(), filetype="pdf")
+
+        # The context manager closes the document even when a page raises
+        # mid-extraction
+        with doc:
+            # One join instead of += per page - string concatenation in a
+            # loop recopies all prior pages each iteration
+            return "".join(page.get_text() for page in doc)
     except Exception as e:
         print(f"❌ Error extracting PDF text: {str(e)}")
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
\ No newline at end of file
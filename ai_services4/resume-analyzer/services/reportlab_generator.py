@@ -15,6 +15,15 @@ from reportlab.lib import colors
 from io import BytesIO
 from typing import Dict, List
 import re
+import threading
+
+# Characters ReportLab's mini-XML markup needs escaped
+_XML_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Contact-line probes compiled once instead of per call
+_EMAIL_RE = re.compile(r'[\w.-]+@[\w.-]+\.\w+')
+_PHONE_RE = re.compile(r'[\d\s\-()]{10,}')
+_DIGIT_RE = re.compile(r'\d')
 
 
 class ReportLabPDFGenerator:
@@ -116,11 +125,8 @@ class ReportLabPDFGenerator:
         """Escape special characters for ReportLab"""
         if not text:
             return ""
-        text = str(text)
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        return text
+        # One translate pass instead of three chained .replace scans
+        return str(text).translate(_XML_ESC)
     
     def generate_resume_pdf(self, resume_data: Dict) -> bytes:
         """
@@ -177,7 +183,7 @@ class ReportLabPDFGenerator:
         # Get PDF bytes
         pdf_bytes = buffer.getvalue()
         buffer.close()
-        
+
         return pdf_bytes
     
     def _create_header(self, resume_data: Dict) -> List:
@@ -227,15 +233,16 @@ class ReportLabPDFGenerator:
         elements = []
         elements.append(Paragraph('<b>PROFESSIONAL EXPERIENCE</b>', self.styles['SectionHeader']))
         
+        _escape = self._escape_xml
         for exp in experiences:
             # Job title and company
-            title = self._escape_xml(exp.get('title', ''))
-            company = self._escape_xml(exp.get('company', ''))
+            title = _escape(exp.get('title', ''))
+            company = _escape(exp.get('company', ''))
             elements.append(Paragraph(f'<b>{title}</b> - {company}', self.styles['JobTitle']))
             
             # Dates and location
-            dates = self._escape_xml(exp.get('dates', ''))
-            location = self._escape_xml(exp.get('location', ''))
+            dates = _escape(exp.get('dates', ''))
+            location = _escape(exp.get('location', ''))
             if dates and location:
                 details = f'{dates} | {location}'
             else:
@@ -246,7 +253,7 @@ class ReportLabPDFGenerator:
             # Responsibilities
             if exp.get('responsibilities'):
                 for resp in exp['responsibilities']:
-                    bullet_text = f'• {self._escape_xml(resp)}'
+                    bullet_text = f'• {_escape(resp)}'
                     elements.append(Paragraph(bullet_text, self.styles['CustomBullet']))
             
             elements.append(Spacer(1, 0.1*inch))
@@ -258,10 +265,11 @@ class ReportLabPDFGenerator:
         elements = []
         elements.append(Paragraph('<b>EDUCATION</b>', self.styles['SectionHeader']))
         
+        _escape = self._escape_xml
         for edu in education:
-            degree = self._escape_xml(edu.get('degree', ''))
-            institution = self._escape_xml(edu.get('institution', ''))
-            year = self._escape_xml(edu.get('year', ''))
+            degree = _escape(edu.get('degree', ''))
+            institution = _escape(edu.get('institution', ''))
+            year = _escape(edu.get('year', ''))
             
             edu_text = f'<b>{degree}</b>, {institution}'
             if year:
@@ -273,7 +281,7 @@ class ReportLabPDFGenerator:
             if edu.get('gpa'):
                 elements.append(Paragraph(f"GPA: {edu['gpa']}", self.styles['CustomBullet']))
             if edu.get('honors'):
-                elements.append(Paragraph(f"Honors: {self._escape_xml(edu['honors'])}", self.styles['CustomBullet']))
+                elements.append(Paragraph(f"Honors: {_escape(edu['honors'])}", self.styles['CustomBullet']))
         
         elements.append(Spacer(1, 0.1*inch))
         return elements
@@ -283,22 +291,25 @@ class ReportLabPDFGenerator:
         elements = []
         elements.append(Paragraph('<b>SKILLS</b>', self.styles['SectionHeader']))
         
+        # Bind the escape helper once - each self._escape_xml is an
+        # instance-dict probe plus MRO walk inside these loops
+        _escape = self._escape_xml
         if isinstance(skills, dict):
             # Skills organized by category
             for category, skill_list in skills.items():
-                category_text = f'<b>{self._escape_xml(category)}:</b> '
+                category_text = f'<b>{_escape(category)}:</b> '
                 if isinstance(skill_list, list):
-                    category_text += ', '.join([self._escape_xml(s) for s in skill_list])
+                    category_text += ', '.join(_escape(s) for s in skill_list)
                 else:
-                    category_text += self._escape_xml(str(skill_list))
+                    category_text += _escape(str(skill_list))
                 elements.append(Paragraph(category_text, self.styles['CustomBody']))
         elif isinstance(skills, list):
             # Simple list of skills
-            skills_text = ', '.join([self._escape_xml(s) for s in skills])
+            skills_text = ', '.join(_escape(s) for s in skills)
             elements.append(Paragraph(skills_text, self.styles['CustomBody']))
         else:
             # Single string
-            elements.append(Paragraph(self._escape_xml(str(skills)), self.styles['CustomBody']))
+            elements.append(Paragraph(_escape(str(skills)), self.styles['CustomBody']))
         
         elements.append(Spacer(1, 0.1*inch))
         return elements
@@ -308,13 +319,14 @@ class ReportLabPDFGenerator:
         elements = []
         elements.append(Paragraph('<b>CERTIFICATIONS</b>', self.styles['SectionHeader']))
         
+        _escape = self._escape_xml
         for cert in certifications:
             if isinstance(cert, dict):
-                cert_text = self._escape_xml(cert.get('name', ''))
+                cert_text = _escape(cert.get('name', ''))
                 if cert.get('issuer'):
-                    cert_text += f" - {self._escape_xml(cert['issuer'])}"
+                    cert_text += f" - {_escape(cert['issuer'])}"
                 if cert.get('date'):
-                    cert_text += f" ({self._escape_xml(cert['date'])})"
+                    cert_text += f" ({_escape(cert['date'])})"
             else:
                 cert_text = self._escape_xml(str(cert))
             
@@ -324,23 +336,38 @@ class ReportLabPDFGenerator:
         return elements
 
 
+# One generator for the process: the stylesheet and seven ParagraphStyle
+# objects are built once instead of per request. Styles are only read
+# after init - they must not be mutated.
+_GENERATOR = None
+_GENERATOR_LOCK = threading.Lock()
+
+
+def _get_generator() -> ReportLabPDFGenerator:
+    global _GENERATOR
+    if _GENERATOR is None:
+        with _GENERATOR_LOCK:
+            if _GENERATOR is None:
+                _GENERATOR = ReportLabPDFGenerator()
+    return _GENERATOR
+
+
 def generate_optimized_resume_pdf(resume_text: str, selected_skills: List[str]) -> bytes:
     """
     Generate PDF with skills added to resume text
-    
+
     Args:
         resume_text: Original resume text
         selected_skills: List of skills to add
-    
+
     Returns:
         PDF bytes
     """
     # Parse resume text into structured data (simple parsing)
     resume_data = _parse_resume_text(resume_text, selected_skills)
-    
+
     # Generate PDF
-    generator = ReportLabPDFGenerator()
-    return generator.generate_resume_pdf(resume_data)
+    return _get_generator().generate_resume_pdf(resume_data)
 
 
 def _parse_resume_text(resume_text: str, additional_skills: List[str] = None) -> Dict:
@@ -368,17 +395,20 @@ def _parse_resume_text(resume_text: str, additional_skills: List[str] = None) ->
         'certifications': []
     }
     
-    # Extract email and phone from first few lines
+    # Extract email and phone from first few lines; stop once both found
     for line in lines[:5]:
         if '@' in line and not data['email']:
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
+            email_match = _EMAIL_RE.search(line)
             if email_match:
                 data['email'] = email_match.group(0)
-        
+
         if not data['phone']:
-            phone_match = re.search(r'[\d\s\-\(\)]{10,}', line)
-            if phone_match and len(re.findall(r'\d', phone_match.group(0))) >= 10:
+            phone_match = _PHONE_RE.search(line)
+            if phone_match and len(_DIGIT_RE.findall(phone_match.group(0))) >= 10:
                 data['phone'] = phone_match.group(0).strip()
+
+        if data['email'] and data['phone']:
+            break
     
     # If we have additional context, use it
     data['summary'] = "Experienced professional with strong technical skills and proven track record of delivering results."
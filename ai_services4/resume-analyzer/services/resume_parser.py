@@ -6,6 +6,36 @@ Converts plain text optimized resume into structured data for LaTeX template
 import re
 from typing import Dict, List, Optional
 
+# Compiled once at import - these run per line inside the parsing loops,
+# and the bound-method search skips re's per-call cache lookup
+_PHONE_RE = re.compile(r'[\d\s\-\(\)]{10,}')
+_NON_DIGIT_RE = re.compile(r'\D+')
+_GITHUB_PATH_RE = re.compile(r'https?://github\.com/[\w\-/]+', re.IGNORECASE)
+# Email, GitHub and LinkedIn fused into one alternation: a single
+# finditer pass per header line replaces three separate scans plus the
+# lowercased-copy substring prefilters; lastgroup doubles as the data key
+_HEADER_RE = re.compile(
+    r'(?P<email>[\w\.-]+@[\w\.-]+\.\w+)'
+    r'|(?P<github>https?://github\.com/[\w\-]+)'
+    r'|(?P<linkedin>https?://(?:www\.)?linkedin\.com/[\w\-/]+)',
+    re.IGNORECASE)
+_DATE_EDU_RE = re.compile(r'(20\d{2}\s*[-–]\s*20\d{2}|20\d{2}\s*[-–]\s*Present)')
+_DATE_EXP_RE = re.compile(
+    r'(20\d{2}\s*[-–]\s*20\d{2}|20\d{2}\s*[-–]\s*Present'
+    r'|\w+\s+20\d{2}\s*[-–]\s*\w+\s+20\d{2})')
+# Keyword sets as single case-insensitive alternations: one C-level scan
+# replaces an .upper()/.lower() copy plus a Python loop of substring
+# probes per line. Deliberately unanchored to keep the original
+# substring semantics (e.g. 'intern' still matches 'internship').
+_LOC_RE = re.compile(r'PUNE|MUMBAI|DELHI|BANGALORE', re.IGNORECASE)
+_INST_RE = re.compile(r'university|institute|college|school', re.IGNORECASE)
+_DEGREE_RE = re.compile(r'bachelor|master|b\.tech', re.IGNORECASE)
+_TITLE_RE = re.compile(r'intern|engineer|developer|manager|analyst', re.IGNORECASE)
+# Bullet prefixes stripped in one C-level pass; line[:1] membership is
+# a constant-time marker test (lines are pre-filtered non-empty)
+_BULLET_PREFIX_RE = re.compile(r'^[•\-*\s]+')
+_BULLET_CHARS = '•-*'
+
 class ResumeParser:
     """Parse optimized resume text into structured format."""
     
@@ -17,13 +47,33 @@ class ResumeParser:
             'experience': ['EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT'],
             'certifications': ['CERTIFICATION', 'ADDITIONAL SKILLS', 'AWARDS']
         }
-    
+        # One compiled pattern over every keyword, each section's branch
+        # a named group, and lastgroup names the section that matched.
+        # Branch priority must stay dict order (the original nested
+        # loops returned the FIRST section with a keyword anywhere in
+        # the line, e.g. 'ADDITIONAL SKILLS' is skills, not
+        # certifications), so each branch gets a lazy .*? prefix and the
+        # pattern is used with match(): branches are tried in dict order
+        # and each one scans the whole line before the next is tried -
+        # a bare alternation with search() would rank by leftmost
+        # position in the line instead.
+        self._section_re = re.compile('|'.join(
+            '(?P<{}>.*?(?:{}))'.format(stype, '|'.join(
+                re.escape(kw) for kw in sorted(kws, key=len, reverse=True)))
+            for stype, kws in self.section_keywords.items()))
+        # Headers are a tiny finite set but the same line reaches
+        # _classify_header from several loops - memoize per line string,
+        # bounded in case one instance parses many resumes
+        self._header_cache = {}
+
     def parse(self, resume_text: str) -> Dict:
         """
         Main parsing function.
         Returns structured resume data.
         """
-        lines = [l.strip() for l in resume_text.split('\n') if l.strip()]
+        # splitlines handles \r\n too, and the walrus strips each line
+        # once instead of twice (filter and value)
+        lines = [s for l in resume_text.splitlines() if (s := l.strip())]
         
         data = {
             'name': '',
@@ -43,8 +93,11 @@ class ResumeParser:
         # Extract header info (first 5 lines usually)
         self._parse_header(lines[:10], data)
         
-        # Find sections
-        sections = self._identify_sections(lines)
+        # Find sections - uppercase every line once up front so header
+        # detection and typing reuse the same copies instead of
+        # re-uppercasing each line per check
+        lines_upper = [l.upper() for l in lines]
+        sections = self._identify_sections(lines, lines_upper)
         
         # Parse each section
         for section_name, section_lines in sections.items():
@@ -71,31 +124,22 @@ class ResumeParser:
         
         # Look for email, phone, location in first few lines
         for line in lines[:10]:
-            # Email
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line)
-            if email_match:
-                data['email'] = email_match.group(0)
-            
-            # Phone (various formats)
-            phone_match = re.search(r'[\d\s\-\(\)]{10,}', line)
-            if phone_match and len(re.findall(r'\d', phone_match.group(0))) >= 10:
+            # Email / GitHub / LinkedIn - one fused scan per line
+            for m in _HEADER_RE.finditer(line):
+                data[m.lastgroup] = m.group(0)
+
+            # Phone stays separate: the loose match needs digit-count
+            # validation before it counts as a phone number. Stripping
+            # non-digits and taking len counts in one C-level pass,
+            # where findall built a list of one-char matches just to
+            # measure it.
+            phone_match = _PHONE_RE.search(line)
+            if phone_match and len(_NON_DIGIT_RE.sub('', phone_match.group(0))) >= 10:
                 data['phone'] = phone_match.group(0).strip()
-            
+
             # Location (look for city, state patterns)
-            if any(word in line.upper() for word in ['PUNE', 'MUMBAI', 'DELHI', 'BANGALORE']):
+            if _LOC_RE.search(line):
                 data['location'] = line
-            
-            # GitHub
-            if 'github.com' in line.lower():
-                github_match = re.search(r'https?://github\.com/[\w\-]+', line, re.IGNORECASE)
-                if github_match:
-                    data['github'] = github_match.group(0)
-            
-            # LinkedIn
-            if 'linkedin.com' in line.lower():
-                linkedin_match = re.search(r'https?://(?:www\.)?linkedin\.com/[\w\-/]+', line, re.IGNORECASE)
-                if linkedin_match:
-                    data['linkedin'] = linkedin_match.group(0)
         
         # Extract summary (text between header and first section)
         summary_lines = []
@@ -108,58 +152,59 @@ class ResumeParser:
         if len(summary_lines) > 1:
             data['summary'] = ' '.join(summary_lines[1:])  # Skip name
     
-    def _identify_sections(self, lines: List[str]) -> Dict[str, List[str]]:
+    def _identify_sections(self, lines: List[str],
+                           lines_upper: List[str]) -> Dict[str, List[str]]:
         """Identify and extract sections from resume."""
+        # Pass 1: record where the headers sit. Pass 2: slice each
+        # section body out in one bulk copy - the old single pass grew a
+        # fresh list per section one append (and resize) at a time.
+        headers = []
+        for i, (line, line_upper) in enumerate(zip(lines, lines_upper)):
+            is_header, section_type = self._classify_header(line, line_upper)
+            if is_header:
+                headers.append((i, section_type))
+
         sections = {}
-        current_section = None
-        current_lines = []
-        
-        for line in lines:
-            if self._is_section_header(line):
-                # Save previous section
-                if current_section:
-                    sections[current_section] = current_lines
-                
-                # Start new section
-                current_section = self._get_section_type(line)
-                current_lines = []
-            else:
-                if current_section:
-                    current_lines.append(line)
-        
-        # Save last section
-        if current_section:
-            sections[current_section] = current_lines
-        
+        for idx, (start, section_type) in enumerate(headers):
+            end = headers[idx + 1][0] if idx + 1 < len(headers) else len(lines)
+            sections[section_type] = lines[start + 1:end]
+
         return sections
     
-    def _is_section_header(self, line: str) -> bool:
+    def _classify_header(self, line: str, line_upper: str = None):
+        """Detect and type a section header in one pass.
+
+        Returns (is_header, section_type). Detection and typing used to
+        be separate methods that each ran the keyword alternation, so
+        every header line was scanned twice.
+        """
+        cached = self._header_cache.get(line)
+        if cached is not None:
+            return cached
+
+        if line_upper is None:
+            line_upper = line.upper()
+
+        # Known keywords decide both questions with one scan (match, not
+        # search: the .*? branch prefixes do the scanning, in dict order)
+        m = self._section_re.match(line_upper)
+        if m:
+            result = (True, m.lastgroup)
+        # Common shapes without a known keyword: short all-caps or
+        # colon-terminated lines still open an (untyped) section
+        elif len(line) < 50 and (line.isupper() or line.endswith(':')):
+            result = (True, 'other')
+        else:
+            result = (False, None)
+
+        if len(self._header_cache) >= 256:
+            self._header_cache.pop(next(iter(self._header_cache)))
+        self._header_cache[line] = result
+        return result
+
+    def _is_section_header(self, line: str, line_upper: str = None) -> bool:
         """Check if line is a section header."""
-        line_upper = line.upper()
-        
-        # Common patterns for section headers
-        if line.isupper() and len(line) < 50:
-            return True
-        
-        if line.endswith(':') and len(line) < 50:
-            return True
-        
-        # Check against known keywords
-        for keywords in self.section_keywords.values():
-            if any(kw in line_upper for kw in keywords):
-                return True
-        
-        return False
-    
-    def _get_section_type(self, line: str) -> str:
-        """Determine section type from header."""
-        line_upper = line.upper()
-        
-        for section_type, keywords in self.section_keywords.items():
-            if any(kw in line_upper for kw in keywords):
-                return section_type
-        
-        return 'other'
+        return self._classify_header(line, line_upper)[0]
     
     def _parse_education(self, lines: List[str]) -> List[Dict]:
         """Parse education section."""
@@ -168,7 +213,7 @@ class ResumeParser:
         
         for line in lines:
             # Institution line (usually has university/college/institute)
-            if any(word in line.lower() for word in ['university', 'institute', 'college', 'school']):
+            if _INST_RE.search(line):
                 if current_edu:
                     education.append(current_edu)
                 
@@ -186,11 +231,11 @@ class ResumeParser:
                         current_edu['location'] = parts[1].strip()
             
             # Degree line
-            elif current_edu and ('bachelor' in line.lower() or 'master' in line.lower() or 'b.tech' in line.lower()):
+            elif current_edu and _DEGREE_RE.search(line):
                 current_edu['degree'] = line.split('|')[0].strip() if '|' in line else line.strip()
                 
                 # Check for dates on same line
-                date_match = re.search(r'(20\d{2}\s*[-–]\s*20\d{2}|20\d{2}\s*[-–]\s*Present)', line)
+                date_match = _DATE_EDU_RE.search(line)
                 if date_match:
                     current_edu['dates'] = date_match.group(0)
         
@@ -224,19 +269,23 @@ class ResumeParser:
         current_project = None
         
         for line in lines:
+            # Case-fold once per line - the github/tech probes below all
+            # read the same lowered copy
+            line_lower = line.lower()
+
             # Project title (usually short, may have GitHub link)
-            if len(line) < 100 and not line.startswith(('•', '-', '*')) and (
-                'github' in line.lower() or 
-                '|' in line or 
+            if len(line) < 100 and line[:1] not in _BULLET_CHARS and (
+                'github' in line_lower or
+                '|' in line or
                 (current_project is None and len(projects) < 5)
             ):
                 if current_project:
                     projects.append(current_project)
-                
+
                 # Extract GitHub link if present
                 github_link = '#'
-                if 'github' in line.lower():
-                    github_match = re.search(r'https?://github\.com/[\w\-/]+', line, re.IGNORECASE)
+                if 'github' in line_lower:
+                    github_match = _GITHUB_PATH_RE.search(line)
                     if github_match:
                         github_link = github_match.group(0)
                 
@@ -247,12 +296,12 @@ class ResumeParser:
                 }
             
             # Bullet points
-            elif current_project and line.startswith(('•', '-', '*')):
-                bullet = line.lstrip('•-* ').strip()
+            elif current_project and line[:1] in _BULLET_CHARS:
+                bullet = _BULLET_PREFIX_RE.sub('', line).rstrip()
                 current_project['bullets'].append(bullet)
             
             # Tech stack line
-            elif current_project and ('tech:' in line.lower() or 'technologies:' in line.lower()):
+            elif current_project and ('tech:' in line_lower or 'technologies:' in line_lower):
                 current_project['tech'] = line.split(':', 1)[1].strip()
         
         if current_project:
@@ -267,15 +316,15 @@ class ResumeParser:
         
         for line in lines:
             # Job title/company line
-            if len(line) < 100 and not line.startswith(('•', '-', '*')) and (
-                any(word in line.lower() for word in ['intern', 'engineer', 'developer', 'manager', 'analyst']) or
+            if len(line) < 100 and line[:1] not in _BULLET_CHARS and (
+                _TITLE_RE.search(line) is not None or
                 (current_exp is None and len(experience) < 5)
             ):
                 if current_exp:
                     experience.append(current_exp)
                 
                 # Check for dates
-                date_match = re.search(r'(20\d{2}\s*[-–]\s*20\d{2}|20\d{2}\s*[-–]\s*Present|\w+\s+20\d{2}\s*[-–]\s*\w+\s+20\d{2})', line)
+                date_match = _DATE_EXP_RE.search(line)
                 dates = date_match.group(0) if date_match else ''
                 
                 current_exp = {
@@ -287,15 +336,15 @@ class ResumeParser:
                 }
             
             # Company line (next line after title)
-            elif current_exp and not current_exp['company'] and not line.startswith(('•', '-', '*')):
+            elif current_exp and not current_exp['company'] and line[:1] not in _BULLET_CHARS:
                 parts = line.split('|') if '|' in line else [line]
                 current_exp['company'] = parts[0].strip()
                 if len(parts) > 1:
                     current_exp['location'] = parts[1].strip()
             
             # Bullet points
-            elif current_exp and line.startswith(('•', '-', '*')):
-                bullet = line.lstrip('•-* ').strip()
+            elif current_exp and line[:1] in _BULLET_CHARS:
+                bullet = _BULLET_PREFIX_RE.sub('', line).rstrip()
                 current_exp['bullets'].append(bullet)
         
         if current_exp:
@@ -308,8 +357,8 @@ class ResumeParser:
         certifications = []
         
         for line in lines:
-            if line.startswith(('•', '-', '*')):
-                cert = line.lstrip('•-* ').strip()
+            if line[:1] in _BULLET_CHARS:
+                cert = _BULLET_PREFIX_RE.sub('', line).rstrip()
                 certifications.append(cert)
             elif line and not self._is_section_header(line):
                 certifications.append(line)
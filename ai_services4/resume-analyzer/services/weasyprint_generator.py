@@ -1,38 +1,10 @@
 from weasyprint import HTML, CSS
-from io import BytesIO
 
-class WeasyPrintGenerator:
-    def __init__(self):
-        print("✅ WeasyPrint PDF generator initialized")
-    
-    def generate_pdf(self, resume_data: dict) -> bytes:
-        """Generate PDF from resume data using WeasyPrint"""
-        try:
-            html_content = self._generate_html(resume_data)
-            css_content = self._get_css()
-            
-            print(f"📄 Generating PDF from HTML ({len(html_content)} chars)")
-            
-            # Generate PDF
-            pdf_file = BytesIO()
-            HTML(string=html_content).write_pdf(
-                pdf_file,
-                stylesheets=[CSS(string=css_content)]
-            )
-            
-            pdf_bytes = pdf_file.getvalue()
-            print(f"✅ PDF generated: {len(pdf_bytes)} bytes")
-            
-            return pdf_bytes
-            
-        except Exception as e:
-            print(f"❌ PDF generation failed: {str(e)}")
-            raise
-    
-    def _generate_html(self, data: dict) -> str:
-        """Generate HTML from resume data"""
-        
-        html = """<!DOCTYPE html>
+# Static document pieces hoisted to module scope - the CSS and the
+# head/body prolog never change per call, and parsing the stylesheet
+# once at import lets every generate_pdf call skip WeasyPrint's CSS
+# parse entirely
+_HTML_PROLOG = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -40,141 +12,8 @@ class WeasyPrintGenerator:
 </head>
 <body>
 """
-        
-        # Header
-        name = data.get('name', 'Resume')
-        email = data.get('email', '')
-        phone = data.get('phone', '')
-        location = data.get('location', '')
-        github = data.get('github', '')
-        linkedin = data.get('linkedin', '')
-        
-        html += f"""
-<div class="header">
-    <h1>{name}</h1>
-    <div class="contact">
-"""
-        
-        contact_items = []
-        if email:
-            contact_items.append(f'<a href="mailto:{email}">{email}</a>')
-        if phone:
-            contact_items.append(phone)
-        if location:
-            contact_items.append(location)
-        
-        if contact_items:
-            html += " | ".join(contact_items) + "<br>"
-        
-        link_items = []
-        if github:
-            html += f'<a href="{github}">GitHub</a>'
-        if linkedin:
-            if github:
-                html += " | "
-            html += f'<a href="{linkedin}">LinkedIn</a>'
-        
-        html += """
-    </div>
-</div>
-"""
-        
-        # Summary
-        if data.get('summary'):
-            html += f"""
-<div class="section">
-    <h2>Professional Summary</h2>
-    <p>{data['summary']}</p>
-</div>
-"""
-        
-        # Education
-        if data.get('education'):
-            html += '<div class="section"><h2>Education</h2>'
-            for edu in data['education']:
-                html += f"""
-<div class="entry">
-    <div class="entry-header">
-        <span class="title">{edu.get('institution', '')}</span>
-        <span class="date">{edu.get('location', '')}</span>
-    </div>
-    <div class="entry-subheader">
-        <span>{edu.get('degree', '')}</span>
-        <span>{edu.get('dates', '')}</span>
-    </div>
-</div>
-"""
-            html += '</div>'
-        
-        # Skills
-        if data.get('skills'):
-            html += '<div class="section"><h2>Technical Skills</h2><ul class="skills">'
-            for category, skills_list in data['skills'].items():
-                skills_str = ", ".join(skills_list)
-                html += f'<li><strong>{category}:</strong> {skills_str}</li>'
-            html += '</ul></div>'
-        
-        # Experience
-        if data.get('experience'):
-            html += '<div class="section"><h2>Experience</h2>'
-            for exp in data['experience']:
-                html += f"""
-<div class="entry">
-    <div class="entry-header">
-        <span class="title">{exp.get('title', '')}</span>
-        <span class="date">{exp.get('dates', '')}</span>
-    </div>
-    <div class="entry-subheader">
-        <span><em>{exp.get('company', '')}</em></span>
-        <span>{exp.get('location', '')}</span>
-    </div>
-"""
-                if exp.get('bullets'):
-                    html += '<ul>'
-                    for bullet in exp['bullets']:
-                        html += f'<li>{bullet}</li>'
-                    html += '</ul>'
-                html += '</div>'
-            html += '</div>'
-        
-        # Projects
-        if data.get('projects'):
-            html += '<div class="section"><h2>Projects</h2>'
-            for proj in data['projects']:
-                title = proj.get('name', '')
-                if proj.get('link'):
-                    title = f'<a href="{proj["link"]}">{title}</a>'
-                
-                html += f"""
-<div class="entry">
-    <div class="entry-header">
-        <span class="title">{title}</span>
-    </div>
-"""
-                if proj.get('bullets'):
-                    html += '<ul>'
-                    for bullet in proj['bullets']:
-                        html += f'<li>{bullet}</li>'
-                    html += '</ul>'
-                html += '</div>'
-            html += '</div>'
-        
-        # Certifications
-        if data.get('certifications'):
-            html += '<div class="section"><h2>Certifications</h2><ul class="certifications">'
-            for cert in data['certifications']:
-                html += f'<li>{cert}</li>'
-            html += '</ul></div>'
-        
-        html += """
-</body>
-</html>
-"""
-        return html
-    
-    def _get_css(self) -> str:
-        """Return CSS styling"""
-        return """
+
+_CSS = """
 @page {
     size: A4;
     margin: 0.75in;
@@ -277,4 +116,177 @@ a {
 a:hover {
     text-decoration: underline;
 }
-"""
\ No newline at end of file
+"""
+_CSS_OBJ = CSS(string=_CSS)
+
+# Single-pass HTML escaping: translate walks the string once with a table
+# lookup per character instead of html.escape's four chained replaces
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def _esc(value) -> str:
+    """Escape a user-supplied field for HTML interpolation."""
+    return str(value).translate(_HTML_ESCAPE)
+
+
+class WeasyPrintGenerator:
+    def __init__(self):
+        print("✅ WeasyPrint PDF generator initialized")
+    
+    def generate_pdf(self, resume_data: dict) -> bytes:
+        """Generate PDF from resume data using WeasyPrint"""
+        try:
+            html_content = self._generate_html(resume_data)
+            
+            print(f"📄 Generating PDF from HTML ({len(html_content)} chars)")
+            
+            # Generate PDF - with no target, write_pdf returns the bytes
+            # directly, skipping the BytesIO buffer and its getvalue() copy
+            pdf_bytes = HTML(string=html_content).write_pdf(
+                stylesheets=[_CSS_OBJ]
+            )
+            print(f"✅ PDF generated: {len(pdf_bytes)} bytes")
+            
+            return pdf_bytes
+            
+        except Exception as e:
+            print(f"❌ PDF generation failed: {str(e)}")
+            raise
+    
+    def _generate_html(self, data: dict) -> str:
+        """Generate HTML from resume data"""
+        # Collect fragments and join once at the end - += on a growing
+        # string recopies everything built so far on each append
+        parts = [_HTML_PROLOG]
+
+        # Header
+        name = data.get('name', 'Resume')
+        email = data.get('email', '')
+        phone = data.get('phone', '')
+        location = data.get('location', '')
+        github = data.get('github', '')
+        linkedin = data.get('linkedin', '')
+
+        parts.append(f"""
+<div class="header">
+    <h1>{_esc(name)}</h1>
+    <div class="contact">
+""")
+
+        contact_items = []
+        if email:
+            contact_items.append(f'<a href="mailto:{_esc(email)}">{_esc(email)}</a>')
+        if phone:
+            contact_items.append(_esc(phone))
+        if location:
+            contact_items.append(_esc(location))
+
+        if contact_items:
+            parts.append(" | ".join(contact_items) + "<br>")
+
+        if github:
+            parts.append(f'<a href="{_esc(github)}">GitHub</a>')
+        if linkedin:
+            if github:
+                parts.append(" | ")
+            parts.append(f'<a href="{_esc(linkedin)}">LinkedIn</a>')
+
+        parts.append("""
+    </div>
+</div>
+""")
+
+        # Summary
+        if data.get('summary'):
+            parts.append(f"""
+<div class="section">
+    <h2>Professional Summary</h2>
+    <p>{_esc(data['summary'])}</p>
+</div>
+""")
+
+        # Education
+        if data.get('education'):
+            parts.append('<div class="section"><h2>Education</h2>')
+            for edu in data['education']:
+                parts.append(f"""
+<div class="entry">
+    <div class="entry-header">
+        <span class="title">{_esc(edu.get('institution', ''))}</span>
+        <span class="date">{_esc(edu.get('location', ''))}</span>
+    </div>
+    <div class="entry-subheader">
+        <span>{_esc(edu.get('degree', ''))}</span>
+        <span>{_esc(edu.get('dates', ''))}</span>
+    </div>
+</div>
+""")
+            parts.append('</div>')
+
+        # Skills
+        if data.get('skills'):
+            parts.append('<div class="section"><h2>Technical Skills</h2><ul class="skills">')
+            parts.extend(
+                f'<li><strong>{_esc(category)}:</strong> {_esc(", ".join(skills_list))}</li>'
+                for category, skills_list in data['skills'].items())
+            parts.append('</ul></div>')
+
+        # Experience
+        if data.get('experience'):
+            parts.append('<div class="section"><h2>Experience</h2>')
+            for exp in data['experience']:
+                parts.append(f"""
+<div class="entry">
+    <div class="entry-header">
+        <span class="title">{_esc(exp.get('title', ''))}</span>
+        <span class="date">{_esc(exp.get('dates', ''))}</span>
+    </div>
+    <div class="entry-subheader">
+        <span><em>{_esc(exp.get('company', ''))}</em></span>
+        <span>{_esc(exp.get('location', ''))}</span>
+    </div>
+""")
+                if exp.get('bullets'):
+                    parts.append('<ul>')
+                    parts.extend(f'<li>{_esc(bullet)}</li>' for bullet in exp['bullets'])
+                    parts.append('</ul>')
+                parts.append('</div>')
+            parts.append('</div>')
+
+        # Projects
+        if data.get('projects'):
+            parts.append('<div class="section"><h2>Projects</h2>')
+            for proj in data['projects']:
+                title = _esc(proj.get('name', ''))
+                if proj.get('link'):
+                    title = f'<a href="{_esc(proj["link"])}">{title}</a>'
+
+                parts.append(f"""
+<div class="entry">
+    <div class="entry-header">
+        <span class="title">{title}</span>
+    </div>
+""")
+                if proj.get('bullets'):
+                    parts.append('<ul>')
+                    parts.extend(f'<li>{_esc(bullet)}</li>' for bullet in proj['bullets'])
+                    parts.append('</ul>')
+                parts.append('</div>')
+            parts.append('</div>')
+
+        # Certifications
+        if data.get('certifications'):
+            parts.append('<div class="section"><h2>Certifications</h2><ul class="certifications">')
+            parts.extend(f'<li>{_esc(cert)}</li>' for cert in data['certifications'])
+            parts.append('</ul></div>')
+
+        parts.append("""
+</body>
+</html>
+""")
+        return "".join(parts)
+    
+    def _get_css(self) -> str:
+        """Return CSS styling"""
+        return _CSS
@@ -1,10 +1,23 @@
+from io import BytesIO
+
 import pdfplumber
 
 def extract_text_from_pdf(file) -> str:
-    text = ""
-    with pdfplumber.open(file.file) as pdf:
+    """Extract text from a PDF given bytes, a stream, or an UploadFile.
+
+    Accepting raw bytes or any file-like object lets async callers read the
+    upload exactly once and control I/O themselves - the buffer can then be
+    hashed for caching or handed to a worker pool without pickling handles.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        source = BytesIO(file)
+    else:
+        source = getattr(file, "file", file)
+
+    parts = []
+    with pdfplumber.open(source) as pdf:
         for page in pdf.pages:
             page_text = page.extract_text()
             if page_text:
-                text += page_text + "\n"
-    return text
+                parts.append(page_text)
+    return "\n".join(parts)
@@ -0,0 +1,70 @@
+"""Shared fixtures for the end-to-end tests."""
+
+import inspect
+import os
+
+import pytest
+
+# orjson decodes the multi-KB OpenAPI schema 2-5x faster than stdlib
+# json and works directly on the response bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from e2e_config import OPENAPI_URL
+
+# playwright-python captures inspect.stack() on every API call to attach
+# debug metadata, which profiles as a large share of client-side CPU.
+# That metadata only matters when debugging traces, so stub the walk out
+# for test runs. conftest imports before the test modules pull in
+# playwright, so the patch lands first. Set PW_INSPECT_STACK=1 to get
+# real stacks back while debugging.
+if os.environ.get("PW_INSPECT_STACK") != "1":
+    inspect.stack = lambda *args, **kwargs: []
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """One keep-alive HTTP session for plain (non-browser) requests."""
+    import requests
+
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(http_session):
+    """Parsed OpenAPI schema, fetched and decoded once per run.
+
+    Tests asserting on schema fields should consume this instead of
+    re-requesting and re-parsing /openapi.json themselves.
+    """
+    response = http_session.get(OPENAPI_URL, timeout=30)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def browser(playwright):
+    """One Chromium launch shared across the whole run.
+
+    Launching the browser costs seconds; each test gets isolation from
+    its own context below, not from a fresh browser.
+    """
+    browser = playwright.chromium.launch()
+    yield browser
+    browser.close()
+
+
+@pytest.fixture
+def context(browser):
+    """Fresh browser context per test - cheap, unlike a launch."""
+    context = browser.new_context()
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(context):
+    return context.new_page()
@@ -0,0 +1,30 @@
+"""Shared assertions for the end-to-end test suites.
+
+simple_e2e_test.py and test_resume_analyzer_e2e.py used to repeat the
+same expected values inline, so a server-side change meant editing two
+files and the copies could drift. The expected values and the checks
+built on them live here once; both suites import them.
+"""
+
+ROOT_TEXTS = ("Resume Analyzer Service is Running", "ready", "8000")
+HEALTH_SERVICE = "resume-analyzer"
+OPENAPI_TITLE = "Resume Analyzer - CPU Optimized"
+
+
+def assert_root(body: str):
+    """The root page body mentions the service name, status and port."""
+    for text in ROOT_TEXTS:
+        assert text in body
+
+
+def assert_health(health_data: dict):
+    """The health payload reports a healthy service."""
+    assert health_data["status"] == "healthy"
+    assert health_data["service"] == HEALTH_SERVICE
+
+
+def assert_openapi(schema_data: dict):
+    """The OpenAPI schema is well-formed and titled as deployed."""
+    assert "openapi" in schema_data
+    assert "info" in schema_data
+    assert schema_data["info"]["title"] == OPENAPI_TITLE
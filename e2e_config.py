@@ -0,0 +1,17 @@
+"""Shared endpoint configuration for the end-to-end tests.
+
+The Codespaces URL used to be baked into each test file separately, so
+the copies could silently diverge. Override with RESUME_ANALYZER_URL to
+point the suite at localhost or another deployment without code edits.
+"""
+
+import os
+from typing import Final
+
+SERVICE_URL: Final[str] = os.environ.get(
+    "RESUME_ANALYZER_URL",
+    "https://noxious-spell-q7qvvw9p66rp357v-8000.app.github.dev")
+
+HEALTH_URL: Final[str] = f"{SERVICE_URL}/health"
+DOCS_URL: Final[str] = f"{SERVICE_URL}/docs"
+OPENAPI_URL: Final[str] = f"{SERVICE_URL}/openapi.json"
@@ -3,72 +3,95 @@ End-to-End Playwright Test for Resume Analyzer Service
 Tests the cloud deployment on GitHub Codespaces
 """
 
-from playwright.sync_api import Page, expect
+import asyncio
 import time
-import json
-
-def test_resume_analyzer_service(page: Page):
-    """Test the Resume Analyzer service endpoints"""
-    
-    # Service URL
-    service_url = "https://noxious-spell-q7qvvw9p66rp357v-8000.app.github.dev"
-    
+
+import pytest
+from playwright.async_api import async_playwright, expect
+from playwright.sync_api import Page
+
+from e2e_assertions import ROOT_TEXTS, assert_health, assert_openapi
+from e2e_config import DOCS_URL, HEALTH_URL, OPENAPI_URL, SERVICE_URL
+
+
+@pytest.mark.asyncio
+async def test_resume_analyzer_service():
+    """Test the Resume Analyzer service endpoints.
+
+    The four endpoint checks are independent navigations that each block
+    on the network, so they run concurrently in their own browser
+    contexts - wall clock is the slowest navigation, not the sum.
+    """
+
     print("🚀 Starting Resume Analyzer End-to-End Test")
     print("=" * 50)
-    
-    # Test 1: Basic Service Health Check
-    print("✅ Test 1: Service Health Check")
-    response = page.goto(service_url)
-    expect(response).to_be_ok()
-    
-    # Check response content
-    content = page.content()
-    assert "Resume Analyzer Service is Running" in content
-    assert "ready" in content
-    assert "8000" in content
-    print("✅ Service is running and responding correctly")
-    
-    # Test 2: Health Endpoint
-    print("✅ Test 2: Health Endpoint")
-    health_response = page.goto(f"{service_url}/health")
-    expect(health_response).to_be_ok()
-    
-    health_content = page.content()
-    health_data = json.loads(health_content.strip('"').replace('\\', ''))
-    assert health_data["status"] == "healthy"
-    assert health_data["service"] == "resume-analyzer"
-    print("✅ Health endpoint responding correctly")
-    
-    # Test 3: Service Documentation
-    print("✅ Test 3: API Documentation")
-    docs_response = page.goto(f"{service_url}/docs")
-    expect(docs_response).to_be_ok()
-    
-    # Check if we can see the FastAPI docs interface
-    page.wait_for_selector("title", timeout=10000)
-    title = page.title()
-    assert "FastAPI" in title or "docs" in title.lower()
-    print("✅ API documentation is accessible")
-    
-    # Test 4: OpenAPI Schema
-    print("✅ Test 4: OpenAPI Schema")
-    schema_response = page.goto(f"{service_url}/openapi.json")
-    expect(schema_response).to_be_ok()
-    
-    schema_content = page.content()
-    schema_data = json.loads(schema_content)
-    assert "openapi" in schema_data
-    assert "info" in schema_data
-    assert schema_data["info"]["title"] == "Resume Analyzer - CPU Optimized"
-    print("✅ OpenAPI schema is valid")
-    
-    # Test 5: CORS Headers
-    print("✅ Test 5: CORS Configuration")
-    cors_response = page.request.get(service_url, headers={"Origin": "http://localhost:5173"})
-    cors_headers = cors_response.headers
-    assert "access-control-allow-origin" in cors_headers
-    print("✅ CORS is properly configured")
-    
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        # JSON endpoints go through the APIRequestContext: no renderer,
+        # no DOM wrapper around the body, and r.json() replaces the old
+        # strip/replace cleanup of HTML-wrapped content
+        api = await playwright.request.new_context()
+
+        async def check(url, validate):
+            context = await browser.new_context()
+            page = await context.new_page()
+            response = await page.goto(url)
+            assert response.ok
+            await validate(page)
+            await context.close()
+
+        async def check_root(page):
+            # Test 1: Basic Service Health Check. expect() polls until
+            # the text appears instead of serializing the whole DOM for
+            # a one-shot substring check, so it tolerates late renders
+            # without a sleep.
+            body = page.locator("body")
+            for text in ROOT_TEXTS:
+                await expect(body).to_contain_text(text)
+            print("✅ Service is running and responding correctly")
+
+        async def check_health():
+            # Test 2: Health Endpoint
+            response = await api.get(HEALTH_URL)
+            assert response.ok
+            health_data = await response.json()
+            assert_health(health_data)
+            print("✅ Health endpoint responding correctly")
+
+        async def check_docs(page):
+            # Test 3: Service Documentation
+            await page.wait_for_selector("title", timeout=10000)
+            title = await page.title()
+            assert "FastAPI" in title or "docs" in title.lower()
+            print("✅ API documentation is accessible")
+
+        async def check_schema():
+            # Test 4: OpenAPI Schema
+            response = await api.get(OPENAPI_URL)
+            assert response.ok
+            schema_data = await response.json()
+            assert_openapi(schema_data)
+            print("✅ OpenAPI schema is valid")
+
+        await asyncio.gather(
+            check(SERVICE_URL, check_root),
+            check_health(),
+            check(DOCS_URL, check_docs),
+            check_schema(),
+        )
+
+        # Test 5: CORS Headers
+        print("✅ Test 5: CORS Configuration")
+        cors_response = await api.get(
+            SERVICE_URL, headers={"Origin": "http://localhost:5173"})
+        cors_headers = cors_response.headers
+        assert "access-control-allow-origin" in cors_headers
+        print("✅ CORS is properly configured")
+
+        await api.dispose()
+        await browser.close()
+
     print("\n🎉 ALL TESTS PASSED!")
     print("=" * 50)
     print("✅ Resume Analyzer Service is fully operational")
@@ -77,26 +100,34 @@ def test_resume_analyzer_service(page: Page):
     print("✅ CORS is configured for frontend integration")
     print("✅ Ready for production use!")
 
+
 def test_service_performance(page: Page):
-    """Test service performance and response times"""
-    
-    service_url = "https://noxious-spell-q7qvvw9p66rp357v-8000.app.github.dev"
-    
+    """Test service performance and response times.
+
+    Stays sync and sequential on purpose - it measures single-request
+    latency, which concurrency would distort.
+    """
+
     print("\n⚡ Performance Testing")
     print("=" * 30)
-    
-    # Test response time
-    start_time = time.time()
-    response = page.goto(service_url)
-    end_time = time.time()
-    
-    response_time = end_time - start_time
-    print(f"✅ Response time: {response_time:.2f} seconds")
-    
+
+    # Warm-up request brings TLS and the Codespaces container out of
+    # cold start so the timed probe measures server latency, not setup
+    page.request.get(SERVICE_URL)
+
+    # Time a plain request with the monotonic clock - page.goto would
+    # fold renderer work into the number, and time.time can jump under
+    # NTP adjustment
+    start = time.perf_counter_ns()
+    page.request.get(SERVICE_URL)
+    response_time_ms = (time.perf_counter_ns() - start) / 1e6
+    print(f"✅ Response time: {response_time_ms:.1f} ms")
+
     # Service should respond within 10 seconds
-    assert response_time < 10, f"Service too slow: {response_time}s"
+    assert response_time_ms < 10_000, f"Service too slow: {response_time_ms:.1f} ms"
     print("✅ Performance is within acceptable limits")
 
+
 if __name__ == "__main__":
     # This can be run with: pytest test_resume_analyzer_e2e.py -v -s
     pass